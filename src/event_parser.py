@@ -1,5 +1,11 @@
 """Docket entry normalization and event parsing."""
 
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
 # Event type categories for normalized docket entries
 EVENT_TYPES: list[str] = [
     "COMPLAINT",
@@ -18,6 +24,9 @@ EVENT_TYPES: list[str] = [
     "OTHER",
 ]
 
+# Position of each event type in EVENT_TYPES, used as categorical codes
+_EVENT_TYPE_CODES: dict[str, int] = {t: i for i, t in enumerate(EVENT_TYPES)}
+
 # Pattern matching rules for event type classification
 # Order matters: specific/longer patterns must come before general/shorter ones
 # Categories with compound terms (e.g., "scheduling order") must be checked before
@@ -46,9 +55,35 @@ _EVENT_PATTERNS: list[tuple[str, list[str]]] = [
 ]
 
 
+def _build_pattern_table() -> tuple[tuple[str, str], ...]:
+    """Flatten _EVENT_PATTERNS into (pattern, event_type) pairs in priority order.
+
+    Patterns that contain another pattern of the same event type (e.g.
+    "notice of appeal" vs "appeal") can never change the result, so they are
+    dropped to save a substring probe per description.
+    """
+    table = []
+    for event_type, patterns in _EVENT_PATTERNS:
+        for pattern in patterns:
+            if any(other != pattern and other in pattern for other in patterns):
+                continue
+            table.append((pattern, event_type))
+    return tuple(table)
+
+
+# Matching walks this table with CPython's substring search, which benchmarks
+# faster than a combined alternation regex or Aho-Corasick automaton for ~30
+# short ASCII keywords against typical docket descriptions.
+_PATTERN_TABLE: tuple[tuple[str, str], ...] = _build_pattern_table()
+
+
+@lru_cache(maxsize=131072)
 def normalize_description(description: str) -> str:
     """Map a raw docket entry description to an EVENT_TYPE category.
 
+    Results are memoized: dockets repeat canonical strings such as
+    "Order granting motion" heavily, so most calls are a cache lookup.
+
     Args:
         description: Raw docket entry text (e.g., "COMPLAINT against ABC Corp...")
 
@@ -59,12 +94,13 @@ def normalize_description(description: str) -> str:
     if not description:
         return "OTHER"
 
+    # One lowercase copy (~100ns for a typical entry) is far cheaper than
+    # matching with re.IGNORECASE, which disables the literal fast paths.
     desc_lower = description.lower()
 
-    for event_type, patterns in _EVENT_PATTERNS:
-        for pattern in patterns:
-            if pattern in desc_lower:
-                return event_type
+    for pattern, event_type in _PATTERN_TABLE:
+        if pattern in desc_lower:
+            return event_type
 
     return "OTHER"
 
@@ -88,16 +124,30 @@ def normalize_description_multi(description: str) -> list[str]:
     desc_lower = description.lower()
     matched_types: list[str] = []
 
-    for event_type, patterns in _EVENT_PATTERNS:
-        for pattern in patterns:
-            if pattern in desc_lower:
-                if event_type not in matched_types:
-                    matched_types.append(event_type)
-                break  # Found a match for this event_type, move to next
+    for pattern, event_type in _PATTERN_TABLE:
+        # Skip remaining patterns of an event_type once it has matched
+        if event_type in matched_types:
+            continue
+        if pattern in desc_lower:
+            matched_types.append(event_type)
 
     return matched_types if matched_types else ["OTHER"]
 
 
+def normalize_descriptions(descriptions: list[str]) -> list[str]:
+    """Map a batch of raw docket entry descriptions to EVENT_TYPE categories.
+
+    Repeats are served from normalize_description's cache.
+
+    Args:
+        descriptions: Raw docket entry texts.
+
+    Returns:
+        List of EVENT_TYPES strings, one per input description, in input order.
+    """
+    return [normalize_description(description) for description in descriptions]
+
+
 def parse_docket_entry(entry: dict) -> dict:
     """Parse a raw docket entry into a normalized event.
 
@@ -136,4 +186,45 @@ def normalize_event_sequence(entries: list[dict]) -> list[dict]:
             - entry_number: Integer entry sequence number
     """
     parsed = [parse_docket_entry(entry) for entry in entries]
-    return sorted(parsed, key=lambda x: x.get("entry_number", 0))
+    # Every parsed event carries an "entry_number" key, so a C-level
+    # itemgetter replaces the per-element lambda call
+    return sorted(parsed, key=itemgetter("entry_number"))
+
+
+def normalize_event_sequence_df(entries_df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a DataFrame of docket entries into events.
+
+    Column-oriented counterpart of normalize_event_sequence() for bulk
+    processing (e.g., a whole entries file). Each distinct description is
+    classified once and the result is broadcast back to every row, so the
+    per-row Python work is limited to the number of unique descriptions.
+
+    Args:
+        entries_df: DataFrame of raw docket entries with columns:
+            - date_filed: Date string
+            - description: Raw docket entry text
+            - entry_number: Integer entry sequence number
+
+    Returns:
+        DataFrame sorted by entry_number (stable) with columns:
+            - date: Date string
+            - event_type: Normalized EVENT_TYPE as a categorical over
+              EVENT_TYPES (int8 codes rather than one string per row)
+            - entry_number: Integer entry sequence number
+    """
+    descriptions = entries_df["description"].fillna("").astype(str)
+    codes, uniques = pd.factorize(descriptions)
+    unique_codes = np.array(
+        [_EVENT_TYPE_CODES[t] for t in normalize_descriptions(list(uniques))],
+        dtype=np.int8,
+    )
+    event_types = pd.Categorical.from_codes(
+        unique_codes.take(codes), categories=EVENT_TYPES
+    )
+
+    events = pd.DataFrame({
+        "date": entries_df["date_filed"].to_numpy(),
+        "event_type": event_types,
+        "entry_number": entries_df["entry_number"].to_numpy(),
+    })
+    return events.sort_values("entry_number", kind="stable").reset_index(drop=True)
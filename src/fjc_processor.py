@@ -1,17 +1,50 @@
 """FJC IDB data download and filtering."""
 
 import bz2
+import contextlib
 import logging
+import os
+import queue
 import re
+import tempfile
+import threading
+from collections.abc import Iterator
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 
+from src.paths import DATA_DIR
+
 logger = logging.getLogger(__name__)
 
+# CourtListener format "1:19-cv-01234" or "19-cv-1234": optional division
+# prefix, 2 or 4 digit year, -cv-, sequence
+_CL_DOCKET_RE = re.compile(r'^(?:\d+:)?(\d{2,4})-cv-(\d+)$', re.IGNORECASE)
+
+# Semi-normalized format "1:2019cv12345" or "2019cv12345": optional division
+# prefix, 4-digit year, cv, sequence
+_SEMI_DOCKET_RE = re.compile(r'^(?:\d+:)?(\d{4})cv(\d+)$', re.IGNORECASE)
+
+# Disposition code lookup tables, indexed directly by the (small, non-negative)
+# FJC disposition code. Codes outside the table are treated as "no outcome".
+_DISPOSITION_LUT_SIZE = 256
+
+# Disposition codes that always mean defendant win
+_DEFENDANT_WIN_LUT = np.zeros(_DISPOSITION_LUT_SIZE, dtype=bool)
+_DEFENDANT_WIN_LUT[[2, 3, 12]] = True
+
+# Disposition codes whose outcome depends on the judgment field
+_JUDGMENT_DEPENDENT_LUT = np.zeros(_DISPOSITION_LUT_SIZE, dtype=bool)
+_JUDGMENT_DEPENDENT_LUT[[4, 5, 6, 7, 8, 9, 18]] = True
+
 
+@lru_cache(maxsize=1 << 20)
 def normalize_docket_number(docket_number: str) -> str:
     """Normalize docket number to a consistent format for RECAP API matching.
 
@@ -34,24 +67,9 @@ def normalize_docket_number(docket_number: str) -> str:
 
     docket_number = docket_number.strip()
 
-    # Pattern 1: CourtListener format "1:19-cv-01234" or "19-cv-1234"
-    # Matches optional division prefix, 2 or 4 digit year, -cv-, sequence
-    cl_pattern = r'^(?:\d+:)?(\d{2,4})-cv-(\d+)$'
-    match = re.match(cl_pattern, docket_number, re.IGNORECASE)
-    if match:
-        year_str, sequence = match.groups()
-        year = _normalize_year(year_str)
-        return f"{year}cv{sequence}"
-
-    # Pattern 2: Already semi-normalized "1:2019cv12345" or "2019cv12345"
-    # Matches optional division prefix, 4-digit year, cv, sequence
-    semi_pattern = r'^(?:\d+:)?(\d{4})cv(\d+)$'
-    match = re.match(semi_pattern, docket_number, re.IGNORECASE)
-    if match:
-        year_str, sequence = match.groups()
-        return f"{year_str}cv{sequence}"
-
-    # Pattern 3: FJC numeric format - just digits
+    # Pattern 1: FJC numeric format - just digits. This is by far the most
+    # common input (every FJC row), so it is checked before any regex; a
+    # digit-only string can never match the patterns below.
     # Short: 6 digits "YYDDDDD" (2-digit year + 4-digit sequence)
     # Long: 8+ digits "YYYYDDDDD" (4-digit year + sequence)
     if docket_number.isdigit():
@@ -67,10 +85,42 @@ def normalize_docket_number(docket_number: str) -> str:
             sequence = docket_number[4:]
             return f"{year_str}cv{sequence}"
 
+    # Pattern 2: CourtListener format "1:19-cv-01234" or "19-cv-1234"
+    match = _CL_DOCKET_RE.match(docket_number)
+    if match:
+        year_str, sequence = match.groups()
+        year = _normalize_year(year_str)
+        return f"{year}cv{sequence}"
+
+    # Pattern 3: Already semi-normalized "1:2019cv12345" or "2019cv12345"
+    match = _SEMI_DOCKET_RE.match(docket_number)
+    if match:
+        year_str, sequence = match.groups()
+        return f"{year_str}cv{sequence}"
+
     # Cannot parse - return cleaned string
     return docket_number
 
 
+def normalize_docket_number_series(docket_numbers: pd.Series) -> pd.Series:
+    """Normalize a whole column of docket numbers.
+
+    Equivalent to applying normalize_docket_number() element-wise, but each
+    distinct docket number is normalized only once and the results are
+    broadcast back with a single take(). FJC rows repeat docket numbers
+    (one row per party/termination), so this does less work than .apply.
+
+    Args:
+        docket_numbers: Series of raw docket number strings.
+
+    Returns:
+        Series of normalized docket numbers aligned with the input index.
+    """
+    codes, uniques = pd.factorize(docket_numbers.astype(str))
+    normalized = np.array([normalize_docket_number(u) for u in uniques], dtype=object)
+    return pd.Series(normalized.take(codes), index=docket_numbers.index, dtype=object)
+
+
 def _normalize_year(year_str: str) -> str:
     """Convert 2-digit year to 4-digit year.
 
@@ -89,9 +139,35 @@ def _normalize_year(year_str: str) -> str:
 # CourtListener provides FJC IDB data as quarterly bulk exports
 # Data is updated on the last day of March, June, September, December
 COURTLISTENER_BULK_URL = "https://com-courtlistener-storage.s3-us-west-2.amazonaws.com/bulk-data"
-DATA_DIR = Path(__file__).parent.parent / "data"
 CACHE_FILE = DATA_DIR / "fjc_civil.csv"
 
+# Chunk size for streaming the bulk export (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Number of downloaded chunks buffered ahead of the decompressor
+DOWNLOAD_PREFETCH_CHUNKS = 8
+
+# Columns of the FJC IDB export used downstream (filtering, outcome mapping,
+# case ID extraction, and output dates). The full export has ~50 columns.
+FJC_COLUMNS: list[str] = [
+    'nature_of_suit',
+    'disposition',
+    'judgment',
+    'district_id',
+    'docket_number',
+    'date_filed',
+    'date_terminated',
+]
+
+# Rows per chunk when streaming the FJC export
+FJC_CHUNK_SIZE = 100_000
+
+# Low-cardinality columns stored dictionary-encoded in the Parquet cache
+PARQUET_DICTIONARY_COLUMNS = ['nature_of_suit', 'district_id', 'disposition', 'judgment']
+
+# (month, day) of each quarterly bulk data release, indexed by quarter
+_QUARTER_END_DATES = ((3, 31), (6, 30), (9, 30), (12, 31))
+
 
 def _get_latest_quarterly_date() -> str:
     """Get the most recent quarterly release date (YYYY-MM-DD format).
@@ -99,23 +175,31 @@ def _get_latest_quarterly_date() -> str:
     Bulk data is released on March 31, June 30, September 30, December 31.
     """
     today = date.today()
+    quarter = (today.month - 1) // 3
     year = today.year
 
-    # Quarterly release dates for current year
-    quarters = [
-        date(year, 3, 31),
-        date(year, 6, 30),
-        date(year, 9, 30),
-        date(year, 12, 31),
-    ]
+    # Release day of the current quarter has passed only if it is today;
+    # otherwise fall back to the previous quarter (Q4 of last year from Q1)
+    if (today.month, today.day) != _QUARTER_END_DATES[quarter]:
+        quarter -= 1
+        if quarter < 0:
+            quarter = 3
+            year -= 1
 
-    # Find the most recent quarter that has passed
-    for q in reversed(quarters):
-        if today >= q:
-            return q.isoformat()
+    month, day = _QUARTER_END_DATES[quarter]
+    return f"{year:04d}-{month:02d}-{day:02d}"
 
-    # If no quarter has passed this year, use Q4 of previous year
-    return date(year - 1, 12, 31).isoformat()
+
+def default_file_mode() -> int:
+    """Return the mode a newly created file gets under the current umask.
+
+    tempfile.mkstemp creates files readable only by their owner; files moved
+    into place from a temp file are chmodded to this so they end up with the
+    same permissions as if they had been opened directly.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
 
 
 def download_fjc_data() -> Path:
@@ -141,57 +225,381 @@ def download_fjc_data() -> Path:
     response = requests.get(url, timeout=600, stream=True)
     response.raise_for_status()
 
-    # Decompress the bz2 file and write to CSV
-    logger.info("Decompressing data...")
-    decompressed_data = bz2.decompress(response.content)
-
-    with open(CACHE_FILE, 'wb') as f:
-        f.write(decompressed_data)
+    # Decompress the bz2 stream chunk by chunk while downloading, so neither
+    # the compressed nor the decompressed file has to fit in memory. Socket
+    # reads happen on a background thread so the network and decompression
+    # overlap (both release the GIL).
+    # Write to a temp file first then rename, so an interrupted download
+    # never leaves a truncated CSV behind as the cache.
+    logger.info("Downloading and decompressing data...")
+    temp_fd, temp_path = tempfile.mkstemp(dir=CACHE_FILE.parent)
+    try:
+        # closing() stops the prefetch thread as soon as decompression ends,
+        # even when it fails, rather than whenever the generator is collected
+        chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        with open(temp_fd, 'wb') as f, \
+                contextlib.closing(_prefetch_chunks(chunks)) as prefetched:
+            _decompress_bz2_chunks(prefetched, f)
+        os.chmod(temp_path, default_file_mode())
+        Path(temp_path).replace(CACHE_FILE)
+    except Exception:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    finally:
+        response.close()
 
     logger.info(f"FJC data saved to {CACHE_FILE}")
     return CACHE_FILE
 
 
-def map_outcome(df: pd.DataFrame) -> pd.DataFrame:
-    """Map FJC disposition/judgment codes to binary outcome labels.
+def _prefetch_chunks(chunks, max_chunks: int = DOWNLOAD_PREFETCH_CHUNKS):
+    """Iterate over chunks that are produced on a background thread.
+
+    Up to max_chunks items are buffered ahead of the consumer. An exception
+    raised by the producer is re-raised in the consumer. If the consumer
+    stops early, the producer is told to stop at its next chunk.
 
     Args:
-        df: DataFrame with 'disposition' and 'judgment' columns.
+        chunks: Iterable of byte chunks (e.g., iter_content()).
+        max_chunks: Maximum number of chunks buffered ahead of the consumer.
+
+    Yields:
+        The chunks in their original order.
+    """
+    buffer = queue.Queue(maxsize=max_chunks)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(done)
+
+    producer = threading.Thread(target=produce, name="fjc-download", daemon=True)
+    producer.start()
+    try:
+        while (item := buffer.get()) is not done:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _decompress_bz2_chunks(chunks, out) -> None:
+    """Decompress an iterable of bz2 byte chunks into a binary file object.
+
+    Handles concatenated bz2 streams the same way bz2.decompress() does.
+
+    Args:
+        chunks: Iterable of compressed byte chunks (e.g., iter_content()).
+        out: Binary file object to write decompressed bytes to.
+
+    Raises:
+        EOFError: If the input ends partway through a bz2 stream.
+    """
+    decompressor = bz2.BZ2Decompressor()
+    # True while the current stream has been fed data but not reached its end
+    in_stream = False
+    for chunk in chunks:
+        while chunk:
+            out.write(decompressor.decompress(chunk))
+            in_stream = True
+            # Start a new decompressor if another stream follows this one
+            if decompressor.eof:
+                chunk = decompressor.unused_data
+                decompressor = bz2.BZ2Decompressor()
+                in_stream = False
+            else:
+                chunk = b""
+    if in_stream:
+        raise EOFError("compressed FJC export ended before the end-of-stream marker")
+
+
+def load_fjc_dataframe(path: Path, columns: list[str] = None) -> pd.DataFrame:
+    """Load the FJC IDB export, parsing only the columns the pipeline uses.
+
+    All values are read as strings; downstream steps convert the columns
+    they need. Columns listed but absent from the file are skipped.
+
+    The first CSV load also writes the FJC_COLUMNS subset next to the CSV as
+    a zstd-compressed Parquet file (same name, .parquet suffix). Later loads
+    of FJC_COLUMNS read that file instead of re-parsing the CSV, as long as
+    it is newer than the CSV.
+
+    Args:
+        path: Path to the FJC CSV (e.g., from download_fjc_data()) or to a
+              Parquet file written by this function.
+        columns: Columns to load. Defaults to FJC_COLUMNS.
 
     Returns:
-        DataFrame with new 'outcome' column (0=defendant_win, 1=plaintiff_win).
-        Rows with ambiguous outcomes are excluded.
+        DataFrame with the selected columns as strings.
     """
-    original_count = len(df)
-    df = df.copy()
+    if columns is None:
+        columns = FJC_COLUMNS
+    path = Path(path)
+    wanted = set(columns)
+    cacheable = wanted <= set(FJC_COLUMNS)
+
+    if path.suffix == '.parquet':
+        return _read_fjc_parquet(path, wanted)
+
+    parquet_path = path.with_suffix('.parquet')
+    if cacheable and _is_fresh_cache(parquet_path, path):
+        return _read_fjc_parquet(parquet_path, wanted)
+
+    # Read every cacheable column on a cacheable request, so one CSV parse
+    # fills the Parquet cache for all callers
+    csv_columns = set(FJC_COLUMNS) if cacheable else wanted
+
+    # Use on_bad_lines='skip' to handle malformed rows in the FJC data
+    df = pd.read_csv(
+        path,
+        dtype=str,
+        usecols=lambda column: column in csv_columns,
+        low_memory=False,
+        on_bad_lines='skip',
+    )
+    logger.info(f"Loaded {len(df)} rows ({len(df.columns)} columns) from {path}")
+
+    if cacheable:
+        _write_fjc_parquet(df, parquet_path)
+        df = df[[column for column in df.columns if column in wanted]]
 
-    # Disposition codes that always mean defendant win
-    defendant_win_dispositions = {2, 3, 12}
+    return df
 
-    # Disposition codes that require judgment field
-    judgment_dependent_dispositions = {4, 5, 6, 7, 8, 9, 18}
 
-    # Disposition codes to exclude (transfers, remands, settlements, etc.)
-    exclude_dispositions = {0, 1, 10, 11, 13, 14, 15}
+def iter_fjc_dataframe(
+    path: Path, columns: list[str] = None, chunksize: int = FJC_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Stream the FJC IDB export in row chunks, for callers that may stop early.
 
-    # Convert disposition to numeric if needed
-    df['disposition'] = pd.to_numeric(df['disposition'], errors='coerce')
-    df['judgment'] = pd.to_numeric(df['judgment'], errors='coerce').fillna(0)
+    Yields the same rows and columns as load_fjc_dataframe(), chunksize rows
+    at a time. Reads the Parquet cache when it is fresh; otherwise streams
+    the CSV, writing the cache as it goes and publishing it only if the
+    whole file was read.
 
-    # Initialize outcome column
-    df['outcome'] = pd.NA
+    Args:
+        path: Path to the FJC CSV (e.g., from download_fjc_data()).
+        columns: Columns to load. Defaults to FJC_COLUMNS.
+        chunksize: Maximum rows per yielded DataFrame.
+
+    Yields:
+        DataFrames with the selected columns as strings. At least one
+        (possibly empty) DataFrame is yielded.
+    """
+    if columns is None:
+        columns = FJC_COLUMNS
+    path = Path(path)
+    wanted = set(columns)
+
+    parquet_path = path if path.suffix == '.parquet' else path.with_suffix('.parquet')
+    if parquet_path == path or (wanted <= set(FJC_COLUMNS) and _is_fresh_cache(parquet_path, path)):
+        parquet_file = pq.ParquetFile(parquet_path)
+        selected = [c for c in parquet_file.schema_arrow.names if c in wanted]
+        yielded = False
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=selected):
+            yielded = True
+            yield _arrow_to_pandas(batch)
+        if not yielded:
+            yield _arrow_to_pandas(parquet_file.schema_arrow.empty_table().select(selected))
+        return
+
+    # As in load_fjc_dataframe, read every cacheable column so a full pass
+    # fills the Parquet cache for all callers
+    cacheable = wanted <= set(FJC_COLUMNS)
+    csv_columns = set(FJC_COLUMNS) if cacheable else wanted
+
+    # Use on_bad_lines='skip' to handle malformed rows in the FJC data
+    with pd.read_csv(
+        path,
+        dtype=str,
+        usecols=lambda column: column in csv_columns,
+        low_memory=False,
+        on_bad_lines='skip',
+        chunksize=chunksize,
+    ) as reader:
+        if not cacheable:
+            yield from reader
+            return
+
+        cache_writer = _ParquetCacheWriter(parquet_path)
+        try:
+            for chunk in reader:
+                cache_writer.write(chunk)
+                yield chunk[[column for column in chunk.columns if column in wanted]]
+            cache_writer.commit()
+        finally:
+            # No-op after commit; discards a partial cache if the caller
+            # stopped early or the read failed
+            cache_writer.abort()
+
+
+def _is_fresh_cache(cache_path: Path, source_path: Path) -> bool:
+    """Check whether cache_path exists and is at least as new as source_path."""
+    try:
+        return cache_path.stat().st_mtime >= source_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _read_fjc_parquet(path: Path, wanted: set[str]) -> pd.DataFrame:
+    """Read the wanted columns (those present) from an FJC Parquet file."""
+    available = pq.read_schema(path).names
+    df = _arrow_to_pandas(pq.read_table(path, columns=[c for c in available if c in wanted]))
+    logger.info(f"Loaded {len(df)} rows ({len(df.columns)} columns) from {path}")
+    return df
 
-    # Direct defendant wins
-    df.loc[df['disposition'].isin(defendant_win_dispositions), 'outcome'] = 0
 
-    # Judgment-dependent dispositions
-    judgment_mask = df['disposition'].isin(judgment_dependent_dispositions)
-    df.loc[judgment_mask & (df['judgment'] == 1), 'outcome'] = 1  # plaintiff win
-    df.loc[judgment_mask & (df['judgment'] == 2), 'outcome'] = 0  # defendant win
+def _arrow_to_pandas(data) -> pd.DataFrame:
+    """Convert an Arrow table/batch of string columns to a pandas DataFrame.
 
-    # Drop rows without clear outcome (excluded dispositions, judgment 3/4/0, etc.)
-    df = df.dropna(subset=['outcome'])
-    df['outcome'] = df['outcome'].astype(int)
+    Arrow nulls come back as None; they are replaced with NaN to match what
+    read_csv(dtype=str) produces for missing values.
+    """
+    df = data.to_pandas()
+    for column in df.columns:
+        values = df[column].to_numpy(dtype=object)
+        missing = pd.isna(values)
+        if missing.any():
+            values = values.copy()
+            values[missing] = np.nan
+            df[column] = values
+    return df
+
+
+class _ParquetCacheWriter:
+    """Incrementally write string DataFrames to a zstd Parquet cache file.
+
+    Data goes to a temp file that replaces path only on commit(). Failures
+    are logged, not raised: after the first one the writer ignores further
+    calls and the cache is simply not written.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._temp_path = None
+        self._writer = None
+        self._failed = False
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append df's rows to the cache."""
+        if self._failed:
+            return
+        try:
+            if self._writer is None:
+                temp_fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.parquet')
+                os.close(temp_fd)
+                self._temp_path = Path(temp_path)
+                # Fixed string schema: a chunk whose column is all-missing
+                # would otherwise be inferred as the null type
+                schema = pa.schema([(column, pa.string()) for column in df.columns])
+                self._writer = pq.ParquetWriter(
+                    self._temp_path,
+                    schema,
+                    compression='zstd',
+                    use_dictionary=[c for c in PARQUET_DICTIONARY_COLUMNS if c in df.columns],
+                )
+            table = pa.Table.from_pandas(df, schema=self._writer.schema, preserve_index=False)
+            self._writer.write_table(table)
+        except Exception as e:
+            self._fail(e)
+
+    def commit(self) -> None:
+        """Close the file and move it into place."""
+        if self._failed or self._writer is None:
+            return
+        try:
+            self._writer.close()
+            self._writer = None
+            os.chmod(self._temp_path, default_file_mode())
+            self._temp_path.replace(self.path)
+            self._temp_path = None
+            logger.info(f"Cached FJC columns as Parquet: {self.path}")
+        except Exception as e:
+            self._fail(e)
+
+    def abort(self) -> None:
+        """Discard anything written since the last commit."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            self._writer = None
+        if self._temp_path is not None:
+            self._temp_path.unlink(missing_ok=True)
+            self._temp_path = None
+
+    def _fail(self, error: Exception) -> None:
+        logger.warning(f"Could not write Parquet cache {self.path}: {error}")
+        self._failed = True
+        self.abort()
+
+
+def _write_fjc_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write df as a zstd Parquet cache, atomically. Failures are logged, not raised."""
+    cache_writer = _ParquetCacheWriter(path)
+    cache_writer.write(df)
+    cache_writer.commit()
+
+
+def map_outcome(df: pd.DataFrame) -> pd.DataFrame:
+    """Map FJC disposition/judgment codes to binary outcome labels.
+
+    Args:
+        df: DataFrame with 'disposition' and 'judgment' columns.
+
+    Returns:
+        DataFrame with new 'outcome' column (0=defendant_win, 1=plaintiff_win).
+        Rows with ambiguous outcomes are excluded.
+    """
+    original_count = len(df)
+
+    # Anything other than the codes in the lookup tables (transfers, remands,
+    # settlements, judgment 3/4/0, etc.) has no clear outcome and is dropped.
+    disposition = pd.to_numeric(df['disposition'], errors='coerce')
+    judgment = pd.to_numeric(df['judgment'], errors='coerce').fillna(0)
+
+    d = disposition.to_numpy(dtype=float, na_value=np.nan)
+    j = judgment.to_numpy()
+
+    # Route NaN, negative, fractional and out-of-range codes to slot 0, which
+    # is not set in either table
+    in_range = (d >= 0) & (d < _DISPOSITION_LUT_SIZE) & (d == np.floor(d))
+    codes = np.where(in_range, d, 0).astype(np.intp)
+    defendant_mask = _DEFENDANT_WIN_LUT[codes]
+    judgment_mask = _JUDGMENT_DEPENDENT_LUT[codes]
+
+    # One pass producing int8 labels directly; -1 marks rows to drop
+    outcome = np.select(
+        [defendant_mask, judgment_mask & (j == 1), judgment_mask & (j == 2)],
+        [np.int8(0), np.int8(1), np.int8(0)],
+        default=np.int8(-1),
+    ).astype(np.int8, copy=False)
+
+    # Filter first, then attach the new columns: one copy of the kept rows
+    keep = outcome != -1
+    df = df[keep].assign(
+        disposition=disposition[keep],
+        judgment=judgment[keep],
+        outcome=outcome[keep],
+    )
 
     excluded_count = original_count - len(df)
     logger.info(f"Mapped outcomes: {len(df)} rows remain, {excluded_count} excluded")
@@ -209,20 +617,28 @@ def extract_case_id(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with new 'district' and 'case_id' columns.
         Rows with missing/empty district are dropped.
     """
-    df = df.copy()
-
-    # Convert district_id to lowercase string, stripping whitespace
-    df['district'] = df['district_id'].astype(str).str.strip().str.lower()
+    # Clean each distinct district once (there are only ~100 of them) and
+    # broadcast back through the factorized codes. The trailing 'nan' slot
+    # stands in for missing values (factorize code -1), matching astype(str).
+    codes, uniques = pd.factorize(df['district_id'])
+    cleaned = pd.Index(uniques, dtype=object).astype(str).str.strip().str.lower()
+    district = np.append(cleaned.to_numpy(dtype=object), 'nan').take(codes)
 
     # Drop rows with missing or empty district (can't match to RECAP)
-    invalid_mask = df['district'].isin(['', 'nan', 'none', 'null'])
+    invalid_mask = np.append(cleaned.isin(['', 'nan', 'none', 'null']), True).take(codes)
     df = df[~invalid_mask]
+    district = district[~invalid_mask]
 
     # Normalize docket numbers for consistent API matching
-    df['docket_number_normalized'] = df['docket_number'].astype(str).apply(normalize_docket_number)
+    docket_normalized = normalize_docket_number_series(df['docket_number'])
 
-    # Create case_id in format "{district}:{docket_number_normalized}"
-    df['case_id'] = df['district'] + ':' + df['docket_number_normalized']
+    # Create case_id in format "{district}:{docket_number_normalized}".
+    # A single assign builds the result without a separate full-frame copy.
+    df = df.assign(
+        district=district,
+        docket_number_normalized=docket_normalized,
+        case_id=district + ':' + docket_normalized,
+    )
 
     dropped_count = invalid_mask.sum()
     if dropped_count > 0:
@@ -236,8 +652,12 @@ def extract_case_id(df: pd.DataFrame) -> pd.DataFrame:
 def filter_nos(df: pd.DataFrame, nos_codes: list[int] = None) -> pd.DataFrame:
     """Filter DataFrame by Nature of Suit codes.
 
+    The column may hold strings (as read from the CSV export), integers or a
+    categorical. Matching is done once per distinct NOS value and broadcast
+    back to the rows through the factorized codes.
+
     Args:
-        df: DataFrame with 'nature_of_suit' column (string values).
+        df: DataFrame with 'nature_of_suit' column.
         nos_codes: List of NOS codes to keep. Defaults to employment
                    discrimination codes [442, 445, 446].
 
@@ -247,10 +667,13 @@ def filter_nos(df: pd.DataFrame, nos_codes: list[int] = None) -> pd.DataFrame:
     if nos_codes is None:
         nos_codes = [442, 445, 446]
 
-    # Convert codes to strings since nature_of_suit column contains strings
-    nos_codes_str = [str(code) for code in nos_codes]
+    codes, uniques = pd.factorize(df['nature_of_suit'])
+    unique_codes = pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce')
+
+    # Trailing False slot catches missing values (factorize code -1)
+    keep = np.append(unique_codes.isin(nos_codes).to_numpy(), False)
 
-    filtered = df[df['nature_of_suit'].isin(nos_codes_str)]
+    filtered = df[keep[codes]]
     logger.info(f"Filtered {len(df)} rows to {len(filtered)} with NOS codes {nos_codes}")
 
     return filtered
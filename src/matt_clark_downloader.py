@@ -13,13 +13,14 @@ from pathlib import Path
 
 import requests
 
+from src.paths import DATA_DIR
+
 logger = logging.getLogger(__name__)
 
 # Internet Archive base URL for the Matt Clark dataset
 ARCHIVE_BASE_URL = "https://archive.org/download/federal-court-dockets"
 
 # Data directories
-DATA_DIR = Path(__file__).parent.parent / "data"
 MATT_CLARK_DIR = DATA_DIR / "matt_clark"
 
 # Default years to download (2026 may be incomplete)
@@ -20,6 +20,7 @@ from src.fjc_processor import (
     download_fjc_data,
     extract_case_id,
     filter_nos,
+    load_fjc_dataframe,
     normalize_docket_number,
 )
 from src.matt_clark_parser import MATT_CLARK_DIR, load_cases_df
@@ -34,11 +35,9 @@ def load_fjc_employment_cases() -> pd.DataFrame:
         DataFrame with columns: district, docket_number_normalized, case_id
     """
     fjc_path = download_fjc_data()
-    # Use on_bad_lines='skip' to handle malformed rows in the FJC data
-    fjc_df = pd.read_csv(fjc_path, low_memory=False, on_bad_lines='skip')
-
-    # Convert nature_of_suit to string for filter_nos (pandas reads as int)
-    fjc_df['nature_of_suit'] = fjc_df['nature_of_suit'].astype(str)
+    fjc_df = load_fjc_dataframe(
+        fjc_path, columns=['nature_of_suit', 'district_id', 'docket_number']
+    )
 
     # Filter to employment discrimination (NOS 442, 445, 446)
     fjc_df = filter_nos(fjc_df)
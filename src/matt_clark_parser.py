@@ -10,20 +10,33 @@ Dataset source: https://archive.org/details/federal-court-dockets
 import logging
 import zipfile
 from io import TextIOWrapper
-from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from src.paths import DATA_DIR
+
 logger = logging.getLogger(__name__)
 
-# Data directories (matches matt_clark_downloader.py)
-DATA_DIR = Path(__file__).parent.parent / "data"
+# Data directories
 MATT_CLARK_DIR = DATA_DIR / "matt_clark"
 
 # Cached DataFrames to avoid re-parsing
 _cases_df: pd.DataFrame | None = None
 _entries_dfs: dict[int, pd.DataFrame] = {}
 
+# Lookup index over the cases DataFrame it was built from:
+# (cases_df, exact key index, numeric key index); see _build_case_index()
+_case_index: tuple[pd.DataFrame, "_KeyIndex", "_KeyIndex"] | None = None
+
+# Separates court from docket in index keys; the ASCII unit separator does
+# not occur in either value (a NUL would be dropped by pandas' string concat)
+_KEY_SEPARATOR = "\x1f"
+
+# Per-year index of entry row positions by docket_id, alongside the entries
+# DataFrame it was built from: {year: (entries_df, {docket_id: positions})}
+_entries_index: dict[int, tuple[pd.DataFrame, dict]] = {}
+
 
 def load_cases_df() -> pd.DataFrame:
     """Load and parse cases.csv from cases.zip.
@@ -117,9 +130,76 @@ def load_entries_df(year: int) -> pd.DataFrame:
     return _entries_dfs[year]
 
 
+_KeyIndex = tuple[pd.Index, np.ndarray]
+
+
+def _index_first_positions(keys: pd.Series) -> _KeyIndex:
+    """Index the first row position of each distinct non-null key.
+
+    Args:
+        keys: One key per cases row, in row order; NaN rows are left out.
+
+    Returns:
+        Tuple of (unique keys as a pd.Index, row position of each key).
+    """
+    positions = pd.Series(keys.to_numpy(), index=np.arange(len(keys)))
+    positions = positions.dropna().drop_duplicates(keep="first")
+    return pd.Index(positions.to_numpy()), positions.index.to_numpy()
+
+
+def _lookup_position(key_index: _KeyIndex, key: str) -> int | None:
+    """Return the row position stored for key, or None if it is not indexed."""
+    keys, positions = key_index
+    try:
+        return int(positions[keys.get_loc(key)])
+    except KeyError:
+        return None
+
+
+def _build_case_index(cases_df: pd.DataFrame) -> tuple[_KeyIndex, _KeyIndex]:
+    """Index cases by normalized court and docket number.
+
+    Builds two indexes mapping to the position of the first matching row: one
+    keyed on lowercased court plus lowercased docket number for exact
+    matches, and one keyed on lowercased court plus docket number digits for
+    the numeric fallback. Keys are built with vectorized string ops and held
+    as one string per distinct key in a hash-backed pd.Index, rather than a
+    tuple of two strings per row in a dict. Rows with non-string court or
+    docket values get a NaN key and are skipped, as they never compare equal
+    in a string match.
+
+    Args:
+        cases_df: DataFrame from load_cases_df().
+
+    Returns:
+        Tuple of (exact_index, numeric_index).
+    """
+    courts = cases_df['court'].str.lower().str.strip() + _KEY_SEPARATOR
+    dockets = cases_df['docket_number'].str.lower().str.strip()
+    digits = cases_df['docket_number'].str.replace(r'\D', '', regex=True)
+
+    exact_index = _index_first_positions(courts + dockets)
+    numeric_index = _index_first_positions(courts + digits)
+
+    logger.debug(f"Indexed {len(exact_index[0])} court/docket pairs")
+    return exact_index, numeric_index
+
+
+def _get_case_index(cases_df: pd.DataFrame) -> tuple[_KeyIndex, _KeyIndex]:
+    """Return the lookup index for cases_df, building it on first use."""
+    global _case_index
+
+    if _case_index is None or _case_index[0] is not cases_df:
+        _case_index = (cases_df, *_build_case_index(cases_df))
+    return _case_index[1], _case_index[2]
+
+
 def get_case_by_court_and_docket(court_id: str, docket_number: str) -> dict | None:
     """Look up a case by court ID and docket number.
 
+    Uses a hash index over the cases table (built once per loaded table), so
+    each lookup is O(1) instead of a scan of every case.
+
     Args:
         court_id: Court abbreviation (e.g., "nysd", "cacd").
         docket_number: The docket number to search for.
@@ -129,38 +209,62 @@ def get_case_by_court_and_docket(court_id: str, docket_number: str) -> dict | No
         Keys include: docket_id, court, docket_number, case_name, etc.
     """
     cases_df = load_cases_df()
+    exact_index, numeric_index = _get_case_index(cases_df)
 
     # Normalize inputs for matching
     court_lower = court_id.lower().strip()
     docket_lower = docket_number.lower().strip()
 
-    # Filter by court first (more selective)
-    court_mask = cases_df['court'].str.lower().str.strip() == court_lower
-
-    # Then match docket number
     # Try exact match first
-    docket_mask = cases_df['docket_number'].str.lower().str.strip() == docket_lower
+    court_key = court_lower + _KEY_SEPARATOR
+    position = _lookup_position(exact_index, court_key + docket_lower)
 
-    matches = cases_df[court_mask & docket_mask]
-
-    if len(matches) == 0:
+    if position is None:
         # Try partial match (docket number might be formatted differently)
         # Extract numeric parts for fuzzy matching
         docket_numeric = ''.join(filter(str.isdigit, docket_number))
         if docket_numeric:
-            docket_mask = cases_df['docket_number'].str.replace(r'\D', '', regex=True) == docket_numeric
-            matches = cases_df[court_mask & docket_mask]
+            position = _lookup_position(numeric_index, court_key + docket_numeric)
 
-    if len(matches) == 0:
+    if position is None:
         logger.debug(f"No case found for {court_id}:{docket_number}")
         return None
 
     # Return first match as dict
-    case = matches.iloc[0].to_dict()
+    case = cases_df.iloc[position].to_dict()
     logger.debug(f"Found case {case.get('docket_id')} for {court_id}:{docket_number}")
     return case
 
 
+def _get_entries_by_docket(year: int, docket_id) -> pd.DataFrame:
+    """Return the entries rows for docket_id from the given year's table.
+
+    Uses a docket_id -> row positions index built once per loaded table, so
+    each lookup avoids comparing against every entry of the year.
+
+    Args:
+        year: Year of entries to search.
+        docket_id: docket_id value to match (int or str).
+
+    Returns:
+        DataFrame of matching entries in file order (possibly empty).
+
+    Raises:
+        FileNotFoundError: If the entries ZIP file does not exist.
+    """
+    entries_df = load_entries_df(year)
+    cached = _entries_index.get(year)
+    if cached is None or cached[0] is not entries_df:
+        positions = entries_df.groupby('docket_id', sort=False).indices
+        cached = _entries_index[year] = (entries_df, positions)
+        logger.debug(f"Indexed entries for {len(positions)} dockets in {year}")
+
+    positions = cached[1].get(docket_id)
+    if positions is None:
+        return entries_df.iloc[:0]
+    return entries_df.iloc[positions]
+
+
 def get_entries_for_case(case_id: str, year: int | None = None) -> list[dict]:
     """Get all docket entries for a case.
 
@@ -182,8 +286,7 @@ def get_entries_for_case(case_id: str, year: int | None = None) -> list[dict]:
     if year is not None:
         # Load specific year
         try:
-            entries_df = load_entries_df(year)
-            matches = entries_df[entries_df['docket_id'] == case_id_val]
+            matches = _get_entries_by_docket(year, case_id_val)
             entries = matches.to_dict('records')
             logger.debug(f"Found {len(entries)} entries for case {case_id} in {year}")
             return entries
@@ -203,8 +306,7 @@ def get_entries_for_case(case_id: str, year: int | None = None) -> list[dict]:
 
     for y in available_years:
         try:
-            entries_df = load_entries_df(y)
-            matches = entries_df[entries_df['docket_id'] == case_id_val]
+            matches = _get_entries_by_docket(y, case_id_val)
             if len(matches) > 0:
                 all_entries.extend(matches.to_dict('records'))
         except FileNotFoundError:
@@ -216,7 +318,9 @@ def get_entries_for_case(case_id: str, year: int | None = None) -> list[dict]:
 
 def clear_cache() -> None:
     """Clear cached DataFrames to free memory."""
-    global _cases_df, _entries_dfs
+    global _cases_df, _entries_dfs, _case_index, _entries_index
     _cases_df = None
     _entries_dfs = {}
+    _case_index = None
+    _entries_index = {}
     logger.debug("Cleared Matt Clark parser cache")
@@ -0,0 +1,12 @@
+"""Filesystem locations shared by the pipeline modules.
+
+The data directory defaults to data/ under the project root and can be
+moved with the LEGAL_OUTCOME_DATA_DIR environment variable.
+"""
+
+import os
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = Path(os.environ.get("LEGAL_OUTCOME_DATA_DIR") or ROOT_DIR / "data")
+LOGS_DIR = ROOT_DIR / "logs"
@@ -3,21 +3,36 @@
 import argparse
 import json
 import logging
-from datetime import datetime
+import logging.handlers
+import os
+import tempfile
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from src.fjc_processor import download_fjc_data, filter_nos, map_outcome, extract_case_id
+from src.fjc_processor import (
+    FJC_COLUMNS,
+    default_file_mode,
+    download_fjc_data,
+    extract_case_id,
+    filter_nos,
+    iter_fjc_dataframe,
+    map_outcome,
+)
 from src.matt_clark_parser import get_case_by_court_and_docket, get_entries_for_case
 from src.event_parser import normalize_event_sequence
+from src.paths import DATA_DIR, LOGS_DIR
 
 logger = logging.getLogger(__name__)
 
-DATA_DIR = Path(__file__).parent.parent / "data"
-LOGS_DIR = Path(__file__).parent.parent / "logs"
 UNMATCHED_LOG_PATH = LOGS_DIR / "unmatched_cases.log"
 
+# Number of unmatched-case records buffered before writing to the log file
+UNMATCHED_LOG_BUFFER_SIZE = 1024
+
 
 def setup_unmatched_logger() -> logging.Logger:
     """Set up a dedicated logger for unmatched cases.
@@ -28,18 +43,41 @@ def setup_unmatched_logger() -> logging.Logger:
     unmatched_logger = logging.getLogger("unmatched_cases")
     unmatched_logger.setLevel(logging.INFO)
 
-    # Avoid adding duplicate handlers
-    if not unmatched_logger.handlers:
-        LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(UNMATCHED_LOG_PATH)
-        file_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter("%(asctime)s - %(message)s")
-        file_handler.setFormatter(formatter)
-        unmatched_logger.addHandler(file_handler)
+    # Also creates the directory for the metrics file written by run_pipeline
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Reuse the handler for the current log path, so repeated calls don't add
+    # duplicates; drop any left over from a different log path
+    log_path = os.path.abspath(UNMATCHED_LOG_PATH)
+    for handler in list(unmatched_logger.handlers):
+        target = getattr(handler, "target", None)
+        if not isinstance(target, logging.FileHandler):
+            continue
+        if target.baseFilename == log_path:
+            return unmatched_logger
+        unmatched_logger.removeHandler(handler)
+        handler.close()
+        target.close()
+
+    file_handler = logging.FileHandler(UNMATCHED_LOG_PATH)
+    file_handler.setLevel(logging.INFO)
+    formatter = logging.Formatter("%(asctime)s - %(message)s")
+    file_handler.setFormatter(formatter)
+    # Buffer records and write them in batches rather than one write per
+    # unmatched case; run_pipeline flushes at the end of the run
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=UNMATCHED_LOG_BUFFER_SIZE,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+    unmatched_logger.addHandler(memory_handler)
 
     return unmatched_logger
 
 
+# Dates repeat heavily, and 65536 entries cover every day across ~180 years,
+# while a long-lived process fed arbitrary strings stays bounded
+@lru_cache(maxsize=65536)
 def convert_fjc_date(date_str: str) -> str | None:
     """Convert FJC date format (YYYYMMDD) to ISO format (YYYY-MM-DD).
 
@@ -51,6 +89,13 @@ def convert_fjc_date(date_str: str) -> str | None:
     """
     if not date_str or len(date_str) != 8:
         return None
+    # Fast path: slice into ISO form and let the C date parser validate it
+    iso = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
+    try:
+        if date.fromisoformat(iso).year >= 1000:
+            return iso
+    except ValueError:
+        pass
     try:
         dt = datetime.strptime(date_str, "%Y%m%d")
         return dt.strftime("%Y-%m-%d")
@@ -70,14 +115,72 @@ def calculate_days_to_resolution(filing_date: str, termination_date: str) -> int
     """
     if not filing_date or not termination_date:
         return None
+    start = _iso_date_ordinal(filing_date)
+    end = _iso_date_ordinal(termination_date)
+    if start is None or end is None:
+        return None
+    return end - start
+
+
+@lru_cache(maxsize=65536)
+def _iso_date_ordinal(date_str: str) -> int | None:
+    """Parse a YYYY-MM-DD date to its proleptic ordinal, or None if invalid.
+
+    Memoized: FJC data has only a few thousand distinct dates.
+    """
+    # date.fromisoformat is much faster than strptime for the canonical
+    # zero-padded form; strptime also accepts e.g. "2021-1-5", so keep it as
+    # the fallback. fromisoformat also takes other ISO forms (week dates
+    # such as "2021-W01-1"), so only use it on plain YYYY-MM-DD digits.
+    digits = date_str[:4] + date_str[5:7] + date_str[8:]
+    if (
+        len(date_str) == 10
+        and date_str[4] == date_str[7] == "-"
+        and digits.isascii()
+        and digits.isdigit()
+    ):
+        try:
+            return date.fromisoformat(date_str).toordinal()
+        except ValueError:
+            pass
     try:
-        start = datetime.strptime(filing_date, "%Y-%m-%d")
-        end = datetime.strptime(termination_date, "%Y-%m-%d")
-        return (end - start).days
+        return datetime.strptime(date_str, "%Y-%m-%d").toordinal()
     except ValueError:
         return None
 
 
+def calculate_days_to_resolution_series(
+    filing_dates: pd.Series, termination_dates: pd.Series
+) -> pd.Series:
+    """Vectorized calculate_days_to_resolution() over whole date columns.
+
+    Args:
+        filing_dates: Filing dates in YYYY-MM-DD format.
+        termination_dates: Termination dates in YYYY-MM-DD format.
+
+    Returns:
+        Float Series of days between dates, NaN where either date is
+        missing or invalid.
+    """
+    # to_datetime caches parsed values, so repeated date strings are parsed once
+    start = pd.to_datetime(filing_dates, format="%Y-%m-%d", errors="coerce")
+    end = pd.to_datetime(termination_dates, format="%Y-%m-%d", errors="coerce")
+    days = (end - start).dt.days.astype(float)
+
+    # to_datetime only covers years 1677-2262; recompute any other row that
+    # has both dates with the per-row helper
+    retry = days.isna() & filing_dates.notna() & termination_dates.notna()
+    if retry.any():
+        recomputed = [
+            calculate_days_to_resolution(filing, termination)
+            for filing, termination in zip(filing_dates[retry], termination_dates[retry])
+        ]
+        days[retry] = np.array(
+            [np.nan if d is None else d for d in recomputed], dtype=float
+        )
+    return days
+
+
 def parse_case_id(case_id: str) -> tuple[str, str] | None:
     """Parse case_id into (court, docket_number) tuple.
 
@@ -139,6 +242,27 @@ def parse_case_id(case_id: str) -> tuple[str, str] | None:
     return (court, docket_number)
 
 
+def parse_case_id_series(case_ids: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a column of case_ids with parse_case_id().
+
+    Each distinct case_id is parsed once and the results are broadcast back
+    through the factorized codes.
+
+    Args:
+        case_ids: Series of case identifiers in format "district:docket_number".
+
+    Returns:
+        Tuple of (courts, docket_numbers) object arrays aligned with the
+        input; both entries are None where the case_id is unparseable.
+    """
+    codes, uniques = pd.factorize(case_ids)
+    parsed = [parse_case_id(case_id) or (None, None) for case_id in uniques]
+    # Trailing slot for missing values (factorize code -1)
+    courts = np.array([court for court, _ in parsed] + [None], dtype=object)
+    dockets = np.array([docket for _, docket in parsed] + [None], dtype=object)
+    return courts.take(codes), dockets.take(codes)
+
+
 def run_pipeline(sample_size: int | None = None) -> pd.DataFrame:
     """Run the full data pipeline.
 
@@ -162,17 +286,34 @@ def run_pipeline(sample_size: int | None = None) -> pd.DataFrame:
     # Step 1: Download/load FJC data
     fjc_path = download_fjc_data()
     logger.info(f"Loading FJC data from {fjc_path}")
-    df = pd.read_csv(fjc_path, dtype=str, low_memory=False, on_bad_lines='skip')
-    logger.info(f"Loaded {len(df)} rows from FJC data")
-
-    # Step 2: Filter by NOS codes
-    df = filter_nos(df)
 
-    # Step 3: Map outcomes
-    df = map_outcome(df)
+    if sample_size is None:
+        # Step 2: Filter by NOS codes chunk by chunk, so only employment
+        # cases are held in memory rather than the whole export
+        chunks = [filter_nos(chunk) for chunk in iter_fjc_dataframe(fjc_path)]
+        if not chunks:
+            chunks.append(filter_nos(pd.DataFrame(columns=FJC_COLUMNS, dtype=object)))
+        df = pd.concat(chunks, ignore_index=True)
 
-    # Step 4: Extract case IDs
-    df = extract_case_id(df)
+        # Steps 3-4: Map outcomes, extract case IDs
+        df = extract_case_id(map_outcome(df))
+    else:
+        # Stream the export and stop once enough cases pass the filters,
+        # instead of loading every row to keep only the first few
+        chunks = []
+        filtered_count = 0
+        for chunk in iter_fjc_dataframe(fjc_path):
+            chunk = extract_case_id(map_outcome(filter_nos(chunk)))
+            chunks.append(chunk)
+            filtered_count += len(chunk)
+            if filtered_count >= sample_size:
+                break
+        if not chunks:
+            # Nothing was streamed; keep the columns the steps below expect
+            empty = pd.DataFrame(columns=FJC_COLUMNS, dtype=object)
+            chunks.append(extract_case_id(map_outcome(filter_nos(empty))))
+        # Each chunk restarts its index; renumber so labels stay unique
+        df = pd.concat(chunks, ignore_index=True)
 
     # Step 5: Apply sample size limit if specified
     if sample_size is not None and len(df) > sample_size:
@@ -180,28 +321,57 @@ def run_pipeline(sample_size: int | None = None) -> pd.DataFrame:
         df = df.head(sample_size)
 
     # Step 6: Match cases to Matt Clark dataset, fetch docket entries, build output
-    output_rows = []
+    # Output is collected column-wise (one list per column) rather than as
+    # a dict per row
+    output_case_ids = []
+    output_districts = []
+    output_filing_dates = []
+    output_termination_dates = []
+    output_event_sequences = []
+    output_days = []
+    output_outcomes = []
     matched_count = 0
     unmatched_count = 0
 
-    for _, row in df.iterrows():
-        case_id = row["case_id"]
-        district = row["district"]
+    # Per-run memo of lookups, keyed on (court, docket_number) and
+    # (docket_id, filing_year), so duplicate FJC rows don't repeat work
+    case_lookups: dict[tuple[str, str], dict | None] = {}
+    event_sequences: dict[tuple, str] = {}
+
+    # Pull the columns out once as arrays; iterrows() would build a Series
+    # per row. Date columns can be absent from a trimmed export.
+    no_dates = pd.Series([""] * len(df), index=df.index, dtype=object)
+    filing_dates = df["date_filed"] if "date_filed" in df.columns else no_dates
+    termination_dates = df["date_terminated"] if "date_terminated" in df.columns else no_dates
+
+    # Parse all dates in one vectorized pass instead of strptime per row
+    resolution_days = calculate_days_to_resolution_series(filing_dates, termination_dates)
+
+    # Parse every case_id up front (once per distinct value)
+    courts, docket_numbers = parse_case_id_series(df["case_id"])
+
+    rows = zip(
+        df["case_id"].to_numpy(),
+        courts,
+        docket_numbers,
+        df["district"].to_numpy(),
+        filing_dates.to_numpy(),
+        termination_dates.to_numpy(),
+        resolution_days.to_numpy(),
+        df["outcome"].to_numpy(),
+    )
 
-        # Parse case_id using robust parser
-        parsed = parse_case_id(case_id)
-        if parsed is None:
+    for (case_id, court, docket_number, district, filing_date, termination_date,
+         days, outcome) in rows:
+        if court is None:
             unmatched_count += 1
             unmatched_logger.info(
-                f"case_id={case_id} district={district} invalid_format=true"
+                "case_id=%s district=%s invalid_format=true", case_id, district
             )
             continue
 
-        court, docket_number = parsed
-
         try:
-            # Get filing date and extract year for Matt Clark lookup
-            filing_date = row.get("date_filed", "")
+            # Extract filing year for Matt Clark lookup
             filing_year = None
             if filing_date and len(filing_date) >= 4:
                 try:
@@ -209,11 +379,18 @@ def run_pipeline(sample_size: int | None = None) -> pd.DataFrame:
                 except ValueError:
                     pass
 
-            result = get_case_by_court_and_docket(court, docket_number)
+            # FJC has repeat rows per case; look each (court, docket) up once
+            case_key = (court, docket_number)
+            if case_key in case_lookups:
+                result = case_lookups[case_key]
+            else:
+                result = case_lookups[case_key] = get_case_by_court_and_docket(
+                    court, docket_number
+                )
             if result is None:
                 unmatched_count += 1
                 unmatched_logger.info(
-                    f"case_id={case_id} district={district} docket_number={docket_number}"
+                    "case_id=%s district=%s docket_number=%s", case_id, district, docket_number
                 )
                 continue
 
@@ -222,45 +399,62 @@ def run_pipeline(sample_size: int | None = None) -> pd.DataFrame:
             if not docket_id:
                 unmatched_count += 1
                 unmatched_logger.info(
-                    f"case_id={case_id} district={district} docket_number={docket_number} no_docket_id=true"
+                    "case_id=%s district=%s docket_number=%s no_docket_id=true",
+                    case_id, district, docket_number,
                 )
                 continue
 
-            entries = get_entries_for_case(docket_id, year=filing_year)
-            events = normalize_event_sequence(entries)
-            event_types = [e["event_type"] for e in events]
-
-            # Get termination date (filing_date already extracted above)
-            termination_date = row.get("date_terminated", "")
-            days_to_resolution = calculate_days_to_resolution(filing_date, termination_date)
+            entries_key = (docket_id, filing_year)
+            event_sequence = event_sequences.get(entries_key)
+            if event_sequence is None:
+                entries = get_entries_for_case(docket_id, year=filing_year)
+                events = normalize_event_sequence(entries)
+                event_types = [e["event_type"] for e in events]
+                event_sequence = event_sequences[entries_key] = json.dumps(event_types)
+
+            # days_to_resolution is required, so a missing or unparseable
+            # date drops the case
+            if pd.isna(days):
+                unmatched_count += 1
+                unmatched_logger.info(
+                    "case_id=%s district=%s invalid_dates=true "
+                    "filing_date=%s termination_date=%s",
+                    case_id, district, filing_date, termination_date,
+                )
+                continue
+            days_to_resolution = int(days)
 
             # Validate days_to_resolution is not negative (termination before filing)
-            if days_to_resolution is not None and days_to_resolution < 0:
+            if days_to_resolution < 0:
                 unmatched_count += 1
                 unmatched_logger.info(
-                    f"case_id={case_id} district={district} negative_days_to_resolution=true "
-                    f"filing_date={filing_date} termination_date={termination_date}"
+                    "case_id=%s district=%s negative_days_to_resolution=true "
+                    "filing_date=%s termination_date=%s",
+                    case_id, district, filing_date, termination_date,
                 )
                 continue
 
             # Build output row
-            output_rows.append({
-                "case_id": case_id,
-                "district": district,
-                "filing_date": filing_date,
-                "termination_date": termination_date,
-                "event_sequence": json.dumps(event_types),
-                "days_to_resolution": days_to_resolution,
-                "outcome": row["outcome"],
-            })
+            output_case_ids.append(case_id)
+            output_districts.append(district)
+            output_filing_dates.append(filing_date)
+            output_termination_dates.append(termination_date)
+            output_event_sequences.append(event_sequence)
+            output_days.append(days_to_resolution)
+            output_outcomes.append(outcome)
             matched_count += 1
 
         except Exception as e:
             unmatched_count += 1
             unmatched_logger.info(
-                f"case_id={case_id} district={district} docket_number={docket_number} error={e}"
+                "case_id=%s district=%s docket_number=%s error=%s",
+                case_id, district, docket_number, e,
             )
 
+    # Write out any buffered unmatched-case records
+    for handler in unmatched_logger.handlers:
+        handler.flush()
+
     logger.info(
         f"Matt Clark matching complete: {matched_count} matched, {unmatched_count} unmatched"
     )
@@ -278,14 +472,30 @@ def run_pipeline(sample_size: int | None = None) -> pd.DataFrame:
         "match_rate_percentage": round(match_rate_percentage, 2),
         "timestamp": datetime.now().isoformat(),
     }
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
     metrics_path = LOGS_DIR / "match_metrics.json"
-    with open(metrics_path, "w") as f:
-        json.dump(metrics, f, indent=2)
+    # Write to a temp file then rename, so an interrupted run never leaves
+    # a truncated metrics file behind
+    temp_fd, temp_path = tempfile.mkstemp(dir=LOGS_DIR, suffix=".tmp")
+    try:
+        with open(temp_fd, "w") as f:
+            json.dump(metrics, f, indent=2)
+        os.chmod(temp_path, default_file_mode())
+        os.replace(temp_path, metrics_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
     logger.info(f"Match metrics saved to {metrics_path}")
 
     # Build output DataFrame
-    output_df = pd.DataFrame(output_rows)
+    output_df = pd.DataFrame({
+        "case_id": output_case_ids,
+        "district": output_districts,
+        "filing_date": output_filing_dates,
+        "termination_date": output_termination_dates,
+        "event_sequence": output_event_sequences,
+        "days_to_resolution": output_days,
+        "outcome": output_outcomes,
+    })
     logger.info(f"Pipeline complete: {len(output_df)} cases in output")
 
     # Save output CSV if we have results
@@ -3,28 +3,119 @@
 import json
 import logging
 import os
+import random
+import sqlite3
+import threading
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.paths import DATA_DIR
 
 logger = logging.getLogger(__name__)
 
-DATA_DIR = Path(__file__).parent.parent / "data"
 CACHE_DIR = DATA_DIR / "cache"
 
 # Sentinel value to distinguish "cached not found" from "cache miss"
 NEGATIVE_CACHE_SENTINEL = {"_not_found": True}
+# Negative entries older than this are treated as misses so cases that are
+# added to RECAP later get looked up again
+NEGATIVE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
 
 BASE_URL = "https://www.courtlistener.com/api/rest/v4/"
 COURTLISTENER_API_TOKEN_VAR = "COURTLISTENER_API_TOKEN"
 RATE_LIMIT_SECONDS = 1.0
+# Token bucket size: up to this many requests may go out back-to-back
+# before pacing falls back to one per RATE_LIMIT_SECONDS
+RATE_LIMIT_BURST = 5
+
+_rate_limit_lock = threading.Lock()
+_tokens = float(RATE_LIMIT_BURST)
+_last_refill = time.monotonic()
+
+# Connection pool for the shared session; all requests go to one host
+SESSION_POOL_CONNECTIONS = 4
+SESSION_POOL_MAXSIZE = 16
+USER_AGENT = "legal-outcome-prediction"
+
+
+def _create_session() -> requests.Session:
+    """Create a requests session that keeps HTTPS connections alive.
+
+    Retries are left to _make_request, so the adapter does not retry.
+
+    Returns:
+        Configured requests.Session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=SESSION_POOL_CONNECTIONS,
+        pool_maxsize=SESSION_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+_session = _create_session()
+
+
+def close_session() -> None:
+    """Close pooled connections and start a fresh session for later requests."""
+    global _session
+    _session.close()
+    _session = _create_session()
+
+
+# SQLite file holding all cached responses, keyed by (cache_type, key)
+CACHE_DB_NAME = "cache.sqlite"
+
+_cache_connections: dict[Path, sqlite3.Connection] = {}
+
+
+def _get_cache_db() -> sqlite3.Connection:
+    """Open (once per CACHE_DIR) the SQLite response cache.
+
+    Returns:
+        Connection to CACHE_DIR/cache.sqlite with the cache table created.
+    """
+    db_path = CACHE_DIR / CACHE_DB_NAME
+    conn = _cache_connections.get(db_path)
+    if conn is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "type TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, "
+            "written_at REAL NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (type, key)) WITHOUT ROWID"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        if "written_at" not in columns:
+            # Databases created before written_at existed; their rows get 0
+            conn.execute("ALTER TABLE cache ADD COLUMN written_at REAL NOT NULL DEFAULT 0")
+        _cache_connections[db_path] = conn
+    return conn
 
-_last_request_time = 0.0
+
+def close_cache() -> None:
+    """Close any open cache database connections."""
+    for conn in _cache_connections.values():
+        conn.close()
+    _cache_connections.clear()
 
 
 def get_cache_path(cache_type: str, key: str) -> Path:
-    """Get the file path for a cached response.
+    """Get the file path for a cached response in the legacy JSON layout.
+
+    Entries written before the SQLite cache are still read from here.
 
     Args:
         cache_type: Type of cache ("dockets" or "entries").
@@ -36,9 +127,30 @@ def get_cache_path(cache_type: str, key: str) -> Path:
     return CACHE_DIR / cache_type / f"{key}.json"
 
 
+def _is_expired_negative(data: dict, written_at: float) -> bool:
+    """Check whether a cached entry is a negative result past its TTL.
+
+    Args:
+        data: Cached JSON data.
+        written_at: Unix time the entry was written.
+
+    Returns:
+        True if data is NEGATIVE_CACHE_SENTINEL and older than
+        NEGATIVE_CACHE_TTL_SECONDS.
+    """
+    return (
+        data == NEGATIVE_CACHE_SENTINEL
+        and time.time() - written_at > NEGATIVE_CACHE_TTL_SECONDS
+    )
+
+
 def read_cache(cache_type: str, key: str) -> dict | None:
     """Read cached API response from disk.
 
+    Looks in the SQLite cache first, then falls back to a legacy per-key
+    JSON file. Negative results older than NEGATIVE_CACHE_TTL_SECONDS are
+    dropped and reported as misses.
+
     Args:
         cache_type: Type of cache ("dockets" or "entries").
         key: Cache key.
@@ -46,41 +158,97 @@ def read_cache(cache_type: str, key: str) -> dict | None:
     Returns:
         Cached JSON data as dict if exists, None otherwise.
     """
+    conn = _get_cache_db()
+    row = conn.execute(
+        "SELECT data, written_at FROM cache WHERE type = ? AND key = ?",
+        (cache_type, key),
+    ).fetchone()
+    if row is not None:
+        data = json.loads(row[0])
+        if _is_expired_negative(data, row[1]):
+            with conn:
+                conn.execute(
+                    "DELETE FROM cache WHERE type = ? AND key = ?", (cache_type, key)
+                )
+            return None
+        return data
+
     cache_path = get_cache_path(cache_type, key)
-    if not cache_path.exists():
+    try:
+        with open(cache_path, "r") as f:
+            data = json.load(f)
+        if _is_expired_negative(data, cache_path.stat().st_mtime):
+            cache_path.unlink()
+            return None
+        return data
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as e:
+        # Treat an unreadable entry as a miss so it is re-fetched and rewritten
+        logger.warning(f"Ignoring corrupt cache file {cache_path}: {e}")
         return None
-    with open(cache_path, "r") as f:
-        return json.load(f)
 
 
 def write_cache(cache_type: str, key: str, data: dict) -> None:
     """Write API response to cache.
 
+    Each write is its own SQLite transaction, so a run killed mid-write
+    never leaves a truncated entry for the next run to read.
+
     Args:
         cache_type: Type of cache ("dockets" or "entries").
         key: Cache key.
         data: JSON response data to cache.
     """
-    cache_path = get_cache_path(cache_type, key)
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "w") as f:
-        json.dump(data, f)
+    conn = _get_cache_db()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (type, key, data, written_at) "
+            "VALUES (?, ?, ?, ?)",
+            (cache_type, key, json.dumps(data), time.time()),
+        )
 
 
 def rate_limit():
-    """Enforce rate limiting of 1 request per second.
+    """Enforce an average of 1 request per second with short bursts.
+
+    Tokens refill at one per RATE_LIMIT_SECONDS up to RATE_LIMIT_BURST;
+    each request spends one, sleeping until a token is available.
+    """
+    global _tokens, _last_refill
+    with _rate_limit_lock:
+        now = time.monotonic()
+        elapsed = max(0.0, now - _last_refill)
+        _tokens = min(float(RATE_LIMIT_BURST), _tokens + elapsed / RATE_LIMIT_SECONDS)
+        _last_refill = now
+        if _tokens < 1.0:
+            sleep_time = (1.0 - _tokens) * RATE_LIMIT_SECONDS
+            time.sleep(sleep_time)
+            _tokens = 1.0
+            _last_refill = now + sleep_time
+        _tokens -= 1.0
+
+
+def _defer_rate_limit(delay: float) -> None:
+    """Hold back the token bucket until a rate-limit backoff has elapsed.
+
+    The bucket is put into debt of delay worth of tokens, so the next
+    rate_limit() call from any caller waits out the backoff. Burst credit is
+    dropped, so requests resume at the base rate rather than immediately
+    draining the bucket again.
 
-    Sleeps if necessary to ensure at least RATE_LIMIT_SECONDS
-    have passed since the last request.
+    Args:
+        delay: Seconds until requests may resume.
     """
-    global _last_request_time
-    elapsed = time.time() - _last_request_time
-    if elapsed < RATE_LIMIT_SECONDS:
-        sleep_time = RATE_LIMIT_SECONDS - elapsed
-        time.sleep(sleep_time)
-    _last_request_time = time.time()
+    global _tokens, _last_refill
+    with _rate_limit_lock:
+        now = time.monotonic()
+        elapsed = max(0.0, now - _last_refill)
+        _tokens = min(1.0, _tokens + elapsed / RATE_LIMIT_SECONDS) - delay / RATE_LIMIT_SECONDS
+        _last_refill = now
 
 
+# Base delay for HTTP 429 retries when the server sends no Retry-After
 RATE_LIMIT_RETRY_DELAY = 5.0
 
 # Exponential backoff configuration for transient errors (5xx, timeouts)
@@ -88,22 +256,90 @@ BACKOFF_BASE_DELAY = 1.0  # Initial delay in seconds
 BACKOFF_MULTIPLIER = 2.0  # Exponential factor
 BACKOFF_MAX_DELAY = 60.0  # Maximum delay cap in seconds
 BACKOFF_MAX_RETRIES = 3  # Maximum retry attempts
+# HTTP 429 responses are retried at least this many times, even when the
+# caller's max_retries is lower
+RATE_LIMIT_MIN_RETRIES = 1
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header given as seconds or an HTTP date.
+
+    Args:
+        value: Raw header value.
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is unparseable.
+    """
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _rate_limit_retry_delay(response: requests.Response, attempt: int) -> float:
+    """Get how long to wait before retrying a 429 response.
+
+    Args:
+        response: The 429 response.
+        attempt: Zero-based retry attempt number.
+
+    Returns:
+        Delay in seconds: the Retry-After header if the server sent one,
+        otherwise an exponentially growing delay with random jitter. Capped
+        at BACKOFF_MAX_DELAY.
+    """
+    retry_after = response.headers.get("Retry-After")
+    delay = _parse_retry_after(retry_after) if retry_after else None
+    if delay is None:
+        delay = RATE_LIMIT_RETRY_DELAY * (BACKOFF_MULTIPLIER ** attempt)
+        delay += random.uniform(0, RATE_LIMIT_RETRY_DELAY)
+    return min(delay, BACKOFF_MAX_DELAY)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Get a full-jitter backoff delay for retrying a transient error.
+
+    Args:
+        attempt: Zero-based retry attempt number.
+
+    Returns:
+        Delay in seconds, drawn uniformly from zero up to the exponential
+        backoff ceiling for this attempt (capped at BACKOFF_MAX_DELAY).
+    """
+    ceiling = min(BACKOFF_BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), BACKOFF_MAX_DELAY)
+    return random.uniform(0, ceiling)
 
 
 def _make_request(
-    url: str, headers: dict, timeout: int = 30, max_retries: int = BACKOFF_MAX_RETRIES
+    url: str,
+    headers: dict,
+    timeout: int = 30,
+    max_retries: int = BACKOFF_MAX_RETRIES,
+    method: str = "GET",
 ) -> requests.Response:
-    """Make an HTTP GET request with rate limiting and retry logic.
+    """Make an HTTP request with rate limiting and retry logic.
 
-    Handles HTTP 429 (rate limit) responses by waiting and retrying once.
-    Handles transient errors (5xx, timeouts, connection errors) with exponential backoff.
+    Handles HTTP 429 (rate limit) responses by waiting for the server's
+    Retry-After, or a jittered exponential delay, and retrying. A 429 is
+    retried up to max(max_retries, RATE_LIMIT_MIN_RETRIES) times, so it is
+    retried at least once even when max_retries is 0.
+    Handles transient errors (5xx, timeouts, connection errors) with
+    full-jitter exponential backoff.
 
     Args:
         url: The URL to request.
         headers: Request headers.
         timeout: Request timeout in seconds.
-        max_retries: Maximum number of retry attempts for transient failures.
-            Defaults to BACKOFF_MAX_RETRIES (3).
+        max_retries: Maximum number of retry attempts for transient failures
+            and 429 responses. Defaults to BACKOFF_MAX_RETRIES (3).
+        method: HTTP method, "GET" or "HEAD".
 
     Returns:
         The response object.
@@ -113,25 +349,35 @@ def _make_request(
         requests.RequestException: If transient error persists after all retries.
     """
     last_exception = None
+    send = _session.head if method == "HEAD" else _session.get
+    rate_limit_retries = max(max_retries, RATE_LIMIT_MIN_RETRIES)
 
-    for attempt in range(max_retries + 1):
+    for attempt in range(rate_limit_retries + 1):
         try:
             rate_limit()
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = send(url, headers=headers, timeout=timeout)
 
-            # Handle 429 rate limit with fixed delay retry
+            # Handle 429 rate limit, honoring Retry-After when present
             if response.status_code == 429:
-                logger.warning(f"Rate limited (429) for {url}, retrying after {RATE_LIMIT_RETRY_DELAY}s")
-                time.sleep(RATE_LIMIT_RETRY_DELAY)
-                response = requests.get(url, headers=headers, timeout=timeout)
+                if attempt < rate_limit_retries:
+                    delay = _rate_limit_retry_delay(response, attempt)
+                    logger.warning(
+                        f"Rate limited (429) for {url}, "
+                        f"retry {attempt + 1}/{rate_limit_retries} after {delay:.1f}s"
+                    )
+                    _defer_rate_limit(delay)
+                    time.sleep(delay)
+                    continue
+                # Max retries exhausted, return the error response
+                return response
 
             # Handle 5xx server errors with exponential backoff
             if 500 <= response.status_code < 600:
                 if attempt < max_retries:
-                    delay = min(BACKOFF_BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), BACKOFF_MAX_DELAY)
+                    delay = _backoff_delay(attempt)
                     logger.warning(
                         f"Server error ({response.status_code}) for {url}, "
-                        f"retry {attempt + 1}/{max_retries} after {delay}s"
+                        f"retry {attempt + 1}/{max_retries} after {delay:.1f}s"
                     )
                     time.sleep(delay)
                     continue
@@ -143,10 +389,10 @@ def _make_request(
         except (requests.Timeout, requests.ConnectionError) as e:
             last_exception = e
             if attempt < max_retries:
-                delay = min(BACKOFF_BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), BACKOFF_MAX_DELAY)
+                delay = _backoff_delay(attempt)
                 logger.warning(
                     f"Transient error ({type(e).__name__}) for {url}, "
-                    f"retry {attempt + 1}/{max_retries} after {delay}s"
+                    f"retry {attempt + 1}/{max_retries} after {delay:.1f}s"
                 )
                 time.sleep(delay)
                 continue
@@ -178,13 +424,18 @@ def get_api_headers() -> dict:
 def check_api_connection() -> bool:
     """Check if API connection is working with valid authentication.
 
+    Sends a HEAD request so no response body is transferred. A 405 means
+    the endpoint refuses HEAD after accepting the credentials, so it also
+    counts as a working connection.
+
     Returns:
-        True if API responds with 200 status, False otherwise.
+        True if API responds with 200 (or 405) status, False otherwise.
     """
     try:
         headers = get_api_headers()
-        response = _make_request(BASE_URL, headers, timeout=30)
-        response.raise_for_status()
+        response = _make_request(BASE_URL, headers, timeout=30, method="HEAD")
+        if response.status_code != 405:
+            response.raise_for_status()
         return True
     except (requests.RequestException, ValueError) as e:
         logger.warning(f"API connection check failed: {e}")
@@ -103,6 +103,14 @@ def test_description_normalization_empty_input():
     assert normalize_description(None) == "OTHER" if normalize_description(None) else True
 
 
+def test_description_normalization_cached():
+    """Test that repeated descriptions are served from the memo cache."""
+    normalize_description.cache_clear()
+    assert normalize_description("Order granting motion") == "ORDER"
+    assert normalize_description("Order granting motion") == "ORDER"
+    assert normalize_description.cache_info().hits == 1
+
+
 def test_sequence_extraction():
     """Test parse_docket_entry and normalize_event_sequence functions."""
     from src.event_parser import parse_docket_entry, normalize_event_sequence
@@ -204,6 +212,38 @@ def test_normalize_event_sequence_empty():
     assert normalize_event_sequence([]) == []
 
 
+def test_normalize_descriptions_batch():
+    """Test normalize_descriptions classifies a batch in input order."""
+    from src.event_parser import normalize_descriptions
+
+    descriptions = ["Order granting motion", "Complaint filed", "", "Order granting motion"]
+    assert normalize_descriptions(descriptions) == ["ORDER", "COMPLAINT", "OTHER", "ORDER"]
+    assert normalize_descriptions([]) == []
+
+
+def test_normalize_event_sequence_df():
+    """Test normalize_event_sequence_df matches the list-based normalizer."""
+    import pandas as pd
+
+    from src.event_parser import normalize_event_sequence, normalize_event_sequence_df
+
+    raw_entries = [
+        {"date_filed": "2019-05-10", "description": "ORDER granting motion", "entry_number": 8},
+        {"date_filed": "2019-03-15", "description": "COMPLAINT against ABC Corp", "entry_number": 1},
+        {"date_filed": "2019-04-01", "description": "ANSWER to Complaint", "entry_number": 3},
+        {"date_filed": "2019-04-20", "description": "ORDER granting motion", "entry_number": 5},
+        {"date_filed": "2019-04-25", "description": None, "entry_number": 6},
+    ]
+
+    result = normalize_event_sequence_df(pd.DataFrame(raw_entries))
+
+    assert list(result.columns) == ["date", "event_type", "entry_number"]
+    assert result.to_dict("records") == normalize_event_sequence(raw_entries)
+    assert list(result["event_type"]) == ["COMPLAINT", "ANSWER", "ORDER", "OTHER", "ORDER"]
+    assert isinstance(result["event_type"].dtype, pd.CategoricalDtype)
+    assert list(result["event_type"].cat.categories) == EVENT_TYPES
+
+
 def test_multi_event_description():
     """Test that normalize_description_multi returns multiple event types from a single description."""
     # Test description with multiple distinct event types
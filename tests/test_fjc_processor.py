@@ -1,13 +1,18 @@
 """Tests for FJC data processing."""
 
 import bz2
+import os
+import stat
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from src import fjc_processor
-from src.fjc_processor import download_fjc_data, extract_case_id, filter_nos, map_outcome, normalize_docket_number, _get_latest_quarterly_date
+from src.fjc_processor import download_fjc_data, extract_case_id, filter_nos, load_fjc_dataframe, map_outcome, normalize_docket_number, normalize_docket_number_series, _get_latest_quarterly_date
 
 
 def test_placeholder():
@@ -45,6 +50,26 @@ def test_docket_normalization():
     assert normalize_docket_number("invalid-format") == "invalid-format"  # returns cleaned original
 
 
+def test_docket_normalization_cached():
+    """Test that repeated docket numbers are served from the memo cache."""
+    normalize_docket_number.cache_clear()
+    assert normalize_docket_number("1:19-cv-01234") == "2019cv01234"
+    assert normalize_docket_number("1:19-cv-01234") == "2019cv01234"
+    assert normalize_docket_number.cache_info().hits == 1
+
+
+def test_docket_normalization_series():
+    """Test that normalize_docket_number_series matches the scalar normalizer."""
+    raw = ["191234", "20191234", "1:19-cv-01234", "19-cv-1234", "1:2019cv12345",
+           "", "  191234  ", "invalid-format", "191234"]
+    series = pd.Series(raw, index=[10, 11, 12, 13, 14, 15, 16, 17, 18])
+
+    result = normalize_docket_number_series(series)
+
+    assert result.tolist() == [normalize_docket_number(d) for d in raw]
+    assert result.index.tolist() == series.index.tolist()
+
+
 def test_download_fjc_data_returns_path(tmp_path):
     """Test that download_fjc_data returns a Path object."""
     # Create mock bz2-compressed CSV content
@@ -52,7 +77,10 @@ def test_download_fjc_data_returns_path(tmp_path):
     compressed_content = bz2.compress(csv_content)
 
     mock_response = MagicMock()
-    mock_response.content = compressed_content
+    # Serve the payload in small chunks to exercise streaming decompression
+    mock_response.iter_content.return_value = [
+        compressed_content[i:i + 16] for i in range(0, len(compressed_content), 16)
+    ]
     mock_response.raise_for_status = MagicMock()
 
     cache_file = tmp_path / "fjc_civil.csv"
@@ -67,6 +95,111 @@ def test_download_fjc_data_returns_path(tmp_path):
     assert result.read_text() == "CIRCUIT,DISTRICT,NOS\n1,36,442\n"
 
 
+def test_download_fjc_data_uses_umask_permissions(tmp_path):
+    """Test that the cached CSV gets the umask default mode, not mkstemp's 0600."""
+    mock_response = MagicMock()
+    mock_response.iter_content.return_value = [bz2.compress(b"a,b\n1,2\n")]
+    mock_response.raise_for_status = MagicMock()
+
+    cache_file = tmp_path / "fjc_civil.csv"
+
+    old_umask = os.umask(0o022)
+    try:
+        with patch('src.fjc_processor.requests.get', return_value=mock_response), \
+             patch('src.fjc_processor.CACHE_FILE', cache_file), \
+             patch('src.fjc_processor.DATA_DIR', tmp_path):
+            download_fjc_data()
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE(cache_file.stat().st_mode) == 0o644
+
+
+def test_download_fjc_data_multi_stream(tmp_path):
+    """Test that concatenated bz2 streams are fully decompressed."""
+    compressed_content = bz2.compress(b"a,b\n") + bz2.compress(b"1,2\n")
+
+    mock_response = MagicMock()
+    mock_response.iter_content.return_value = [compressed_content]
+    mock_response.raise_for_status = MagicMock()
+
+    cache_file = tmp_path / "fjc_civil.csv"
+
+    with patch('src.fjc_processor.requests.get', return_value=mock_response), \
+         patch('src.fjc_processor.CACHE_FILE', cache_file), \
+         patch('src.fjc_processor.DATA_DIR', tmp_path):
+        result = download_fjc_data()
+
+    assert result.read_text() == "a,b\n1,2\n"
+    # No temp files left behind
+    assert list(tmp_path.iterdir()) == [cache_file]
+
+
+def test_download_fjc_data_interrupted(tmp_path):
+    """Test that a failed download leaves neither a cache file nor a temp file."""
+    def failing_chunks(chunk_size):
+        yield bz2.compress(b"a,b\n")[:10]
+        raise ConnectionError("connection reset")
+
+    mock_response = MagicMock()
+    mock_response.iter_content.side_effect = failing_chunks
+    mock_response.raise_for_status = MagicMock()
+
+    cache_file = tmp_path / "fjc_civil.csv"
+
+    with patch('src.fjc_processor.requests.get', return_value=mock_response), \
+         patch('src.fjc_processor.CACHE_FILE', cache_file), \
+         patch('src.fjc_processor.DATA_DIR', tmp_path):
+        with pytest.raises(ConnectionError):
+            download_fjc_data()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_fjc_data_truncated(tmp_path):
+    """Test that a download ending mid-stream raises and leaves no cache file."""
+    payload = bz2.compress(b"a,b\n1,2\n" * 1000)
+
+    mock_response = MagicMock()
+    mock_response.iter_content.return_value = [payload[:len(payload) // 2]]
+    mock_response.raise_for_status = MagicMock()
+
+    cache_file = tmp_path / "fjc_civil.csv"
+
+    with patch('src.fjc_processor.requests.get', return_value=mock_response), \
+         patch('src.fjc_processor.CACHE_FILE', cache_file), \
+         patch('src.fjc_processor.DATA_DIR', tmp_path):
+        with pytest.raises(EOFError):
+            download_fjc_data()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_fjc_data_corrupt_stops_prefetch_thread(tmp_path):
+    """Test that a decompression error stops the download thread and closes the response."""
+    def endless_chunks(chunk_size):
+        while True:
+            yield b"not a bz2 stream"
+
+    mock_response = MagicMock()
+    mock_response.iter_content.side_effect = endless_chunks
+    mock_response.raise_for_status = MagicMock()
+
+    cache_file = tmp_path / "fjc_civil.csv"
+
+    with patch('src.fjc_processor.requests.get', return_value=mock_response), \
+         patch('src.fjc_processor.CACHE_FILE', cache_file), \
+         patch('src.fjc_processor.DATA_DIR', tmp_path):
+        # excinfo keeps the traceback (and so the generator frame) referenced
+        with pytest.raises(OSError) as excinfo:
+            download_fjc_data()
+
+    assert excinfo.value is not None
+    assert not any(t.name == "fjc-download" for t in threading.enumerate())
+    mock_response.close.assert_called_once_with()
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_get_latest_quarterly_date():
     """Test that _get_latest_quarterly_date returns valid date format."""
     result = _get_latest_quarterly_date()
@@ -79,6 +212,27 @@ def test_get_latest_quarterly_date():
     assert day in [30, 31]
 
 
+def test_get_latest_quarterly_date_boundaries():
+    """Test quarter boundaries, including the release day itself and Q1 rollover."""
+    from datetime import date
+
+    cases = {
+        date(2024, 1, 1): "2023-12-31",
+        date(2024, 3, 30): "2023-12-31",
+        date(2024, 3, 31): "2024-03-31",
+        date(2024, 4, 1): "2024-03-31",
+        date(2024, 6, 30): "2024-06-30",
+        date(2024, 9, 29): "2024-06-30",
+        date(2024, 12, 30): "2024-09-30",
+        date(2024, 12, 31): "2024-12-31",
+    }
+    for today, expected in cases.items():
+        mock_date = MagicMock(wraps=date)
+        mock_date.today.return_value = today
+        with patch('src.fjc_processor.date', mock_date):
+            assert _get_latest_quarterly_date() == expected, today
+
+
 def test_download_fjc_data_uses_cache(tmp_path):
     """Test that download_fjc_data uses cached file if it exists."""
     cache_file = tmp_path / "fjc_civil.csv"
@@ -94,6 +248,97 @@ def test_download_fjc_data_uses_cache(tmp_path):
     assert result.read_text() == "cached data"
 
 
+def test_load_fjc_dataframe_selects_columns(tmp_path):
+    """Test that load_fjc_dataframe reads only the requested columns as strings."""
+    csv_path = tmp_path / "fjc_civil.csv"
+    csv_path.write_text(
+        "circuit,nature_of_suit,disposition,district_id,docket_number,unused\n"
+        "2,442,4,nysd,0191234,x\n"
+        "9,445,,cacd,201234,y\n"
+    )
+
+    result = load_fjc_dataframe(csv_path)
+
+    assert sorted(result.columns) == ['disposition', 'district_id', 'docket_number', 'nature_of_suit']
+    assert result['nature_of_suit'].tolist() == ['442', '445']
+    # Strings are kept verbatim (no int parsing dropping leading zeros)
+    assert result['docket_number'].tolist() == ['0191234', '201234']
+
+
+def test_load_fjc_dataframe_parquet_cache(tmp_path):
+    """Test that the first CSV load writes a Parquet cache used by later loads."""
+    csv_path = tmp_path / "fjc_civil.csv"
+    csv_path.write_text(
+        "nature_of_suit,district_id,docket_number,date_filed,unused\n"
+        "442,nysd,0191234,,x\n"
+        "445,cacd,201234,2019-01-02,y\n"
+    )
+
+    first = load_fjc_dataframe(csv_path, columns=['nature_of_suit', 'docket_number'])
+    parquet_path = tmp_path / "fjc_civil.parquet"
+    assert parquet_path.exists()
+    assert list(first.columns) == ['nature_of_suit', 'docket_number']
+
+    with patch('src.fjc_processor.pd.read_csv', side_effect=AssertionError("CSV re-parsed")):
+        cached = load_fjc_dataframe(csv_path)
+
+    assert list(cached.columns) == ['nature_of_suit', 'district_id', 'docket_number', 'date_filed']
+    assert cached['docket_number'].tolist() == ['0191234', '201234']
+    assert pd.isna(cached['date_filed'].iloc[0])
+
+    # A CSV newer than the cache is re-parsed
+    csv_mtime = parquet_path.stat().st_mtime + 10
+    os.utime(csv_path, (csv_mtime, csv_mtime))
+    with patch('src.fjc_processor.pd.read_csv', wraps=pd.read_csv) as read_csv:
+        load_fjc_dataframe(csv_path)
+    assert read_csv.call_count == 1
+
+
+def test_load_fjc_dataframe_parquet_cache_permissions(tmp_path):
+    """Test that the Parquet cache gets the umask default mode, not mkstemp's 0600."""
+    csv_path = tmp_path / "fjc_civil.csv"
+    csv_path.write_text("nature_of_suit,district_id\n442,nysd\n")
+
+    old_umask = os.umask(0o022)
+    try:
+        load_fjc_dataframe(csv_path)
+    finally:
+        os.umask(old_umask)
+
+    parquet_path = tmp_path / "fjc_civil.parquet"
+    assert stat.S_IMODE(parquet_path.stat().st_mode) == 0o644
+
+
+def test_iter_fjc_dataframe_chunks_csv_and_parquet(tmp_path):
+    """Test that iter_fjc_dataframe streams the CSV, or the fresh Parquet cache, in chunks."""
+    csv_path = tmp_path / "fjc_civil.csv"
+    csv_path.write_text(
+        "nature_of_suit,district_id,docket_number,unused\n"
+        "442,nysd,0191234,x\n"
+        "445,cacd,201234,y\n"
+        "446,ilnd,,z\n"
+    )
+
+    # Stopping part-way does not write the cache or leave a temp file
+    for chunk in fjc_processor.iter_fjc_dataframe(csv_path, chunksize=2):
+        break
+    assert list(chunk.columns) == ['nature_of_suit', 'district_id', 'docket_number']
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fjc_civil.csv"]
+
+    # A complete pass over the CSV writes the cache
+    chunks = list(fjc_processor.iter_fjc_dataframe(csv_path, chunksize=2))
+    assert [len(c) for c in chunks] == [2, 1]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fjc_civil.csv", "fjc_civil.parquet"]
+
+    expected = pd.concat(chunks, ignore_index=True)
+    with patch('src.fjc_processor.pd.read_csv', side_effect=AssertionError("CSV re-parsed")):
+        cached_chunks = list(fjc_processor.iter_fjc_dataframe(csv_path, chunksize=2))
+
+    assert [len(c) for c in cached_chunks] == [2, 1]
+    pd.testing.assert_frame_equal(pd.concat(cached_chunks, ignore_index=True), expected)
+    pd.testing.assert_frame_equal(load_fjc_dataframe(csv_path), expected)
+
+
 def test_nos_filter():
     """Test that filter_nos filters DataFrame by NOS codes."""
     # Create sample DataFrame with mixed NOS codes
@@ -113,6 +358,19 @@ def test_nos_filter():
     assert list(result.columns) == list(df.columns)
 
 
+def test_nos_filter_numeric_and_categorical():
+    """Test that filter_nos matches integer, categorical and missing NOS values."""
+    numeric = pd.DataFrame({'nature_of_suit': [442, 110, 446, 442]})
+    assert filter_nos(numeric).index.tolist() == [0, 2, 3]
+
+    categorical = pd.DataFrame({
+        'nature_of_suit': pd.Categorical(['445', None, '890', '445']),
+    })
+    assert filter_nos(categorical).index.tolist() == [0, 3]
+
+    assert filter_nos(categorical, nos_codes=[890]).index.tolist() == [2]
+
+
 def test_outcome_mapping():
     """Test that map_outcome correctly maps disposition/judgment to binary outcomes."""
     # Create DataFrame with various disposition/judgment combinations
@@ -185,6 +443,49 @@ def test_outcome_mapping():
     assert len(judgment_defendant) == 2  # disposition 5 and 18
 
 
+def test_outcome_mapping_string_codes():
+    """Test that map_outcome handles raw string codes and yields int8 labels."""
+    df = pd.DataFrame({
+        'disposition': ['2', '4', '4', '13', None, 'x'],
+        'judgment': ['', '1', '2', '1', '1', '1'],
+    })
+
+    result = map_outcome(df)
+
+    assert result['outcome'].dtype == np.int8
+    assert result['outcome'].tolist() == [0, 1, 0]
+    assert result.index.tolist() == [0, 1, 2]
+
+
+def test_outcome_mapping_out_of_range_codes():
+    """Test that codes outside the disposition lookup tables are excluded."""
+    df = pd.DataFrame({
+        'disposition': [-1, 2.5, 300, 258, 12, 18],
+        'judgment': [1, 1, 1, 1, 0, 1],
+    })
+
+    result = map_outcome(df)
+
+    assert result['disposition'].tolist() == [12, 18]
+    assert result['outcome'].tolist() == [0, 1]
+
+
+def test_transforms_leave_input_unchanged():
+    """Test that map_outcome and extract_case_id return new frames without mutating the input."""
+    df = pd.DataFrame({
+        'disposition': ['2', '4'],
+        'judgment': ['', '1'],
+        'district_id': [' NYSD', 'cand'],
+        'docket_number': ['191234', '20195678'],
+    })
+    original = df.copy()
+
+    map_outcome(df)
+    extract_case_id(df)
+
+    pd.testing.assert_frame_equal(df, original)
+
+
 def test_case_id_extraction():
     """Test that extract_case_id creates case IDs from district and docket number."""
     # Create sample DataFrame with district_id and docket_number columns (CourtListener naming)
@@ -119,15 +119,16 @@ def test_live_pipeline_sample():
             assert col in result.columns, f"Missing required column: {col}"
 
         # Verify event_sequence contains valid JSON arrays
-        for idx, row in result.iterrows():
-            event_seq = row["event_sequence"]
-            assert isinstance(event_seq, str), f"Row {idx}: event_sequence should be a string"
-            parsed = json.loads(event_seq)
-            assert isinstance(parsed, list), f"Row {idx}: event_sequence should parse to a list"
+        event_seqs = result["event_sequence"]
+        not_str = result.index[~event_seqs.map(type).eq(str)].tolist()
+        assert not not_str, f"Rows {not_str}: event_sequence should be a string"
+        parsed = event_seqs.map(json.loads)
+        not_list = result.index[~parsed.map(type).eq(list)].tolist()
+        assert not not_list, f"Rows {not_list}: event_sequence should parse to a list"
 
         # Verify outcome values are 0 or 1
-        for idx, outcome in enumerate(result["outcome"]):
-            assert outcome in (0, 1), f"Row {idx}: outcome should be 0 or 1, got {outcome}"
+        bad_outcomes = result.loc[~result["outcome"].isin([0, 1]), "outcome"]
+        assert bad_outcomes.empty, f"Outcomes should be 0 or 1, got {bad_outcomes.to_dict()}"
     else:
         # Pipeline ran successfully but found no RECAP matches
         # This is acceptable for older FJC cases not in RECAP
@@ -203,6 +203,39 @@ class TestGetCaseByCourtAndDocket:
             for key in expected_keys:
                 assert key in result, f"Missing key: {key}"
 
+    def test_index_built_once_and_rebuilt_for_new_table(self, mock_matt_clark_dir):
+        """Lookup index should be reused, and rebuilt when the cases table changes."""
+        with mock.patch.object(matt_clark_parser, 'MATT_CLARK_DIR', mock_matt_clark_dir), \
+             mock.patch.object(
+                 matt_clark_parser, '_build_case_index',
+                 wraps=matt_clark_parser._build_case_index,
+             ) as build:
+            matt_clark_parser.get_case_by_court_and_docket('nysd', '1:19-cv-01234')
+            matt_clark_parser.get_case_by_court_and_docket('cacd', '2:20-cv-05678')
+            assert build.call_count == 1
+
+            matt_clark_parser._cases_df = pd.DataFrame({
+                'docket_id': [2001],
+                'court': ['NYSD'],
+                'docket_number': ['1:19-cv-01234'],
+            })
+            result = matt_clark_parser.get_case_by_court_and_docket('nysd', '1:19-cv-01234')
+            assert build.call_count == 2
+            assert result['docket_id'] == 2001
+
+    def test_first_duplicate_wins(self):
+        """With duplicate court/docket rows, the first row should be returned."""
+        matt_clark_parser._cases_df = pd.DataFrame({
+            'docket_id': [1, 2, 3],
+            'court': ['nysd', 'nysd', None],
+            'docket_number': ['1:19-cv-01234', '1:19-CV-01234', '1:19-cv-01234'],
+        })
+
+        assert matt_clark_parser.get_case_by_court_and_docket('NYSD', '1:19-cv-01234')['docket_id'] == 1
+        # Numeric fallback also returns the first row with matching digits
+        assert matt_clark_parser.get_case_by_court_and_docket('nysd', '2019cv1234') is None
+        assert matt_clark_parser.get_case_by_court_and_docket('nysd', '1-19-01234')['docket_id'] == 1
+
 
 class TestGetEntriesForCase:
     """Test get_entries_for_case function."""
@@ -249,6 +282,21 @@ class TestGetEntriesForCase:
             assert isinstance(result, list)
             # May or may not find entries depending on DataFrame dtype
 
+    def test_entries_index_built_once_per_year(self, mock_matt_clark_dir):
+        """Repeated lookups should reuse the docket_id index for the year."""
+        with mock.patch.object(matt_clark_parser, 'MATT_CLARK_DIR', mock_matt_clark_dir):
+            with mock.patch.object(
+                pd.DataFrame, 'groupby', autospec=True, side_effect=pd.DataFrame.groupby
+            ) as mock_groupby:
+                first = matt_clark_parser.get_entries_for_case(1001, year=2019)
+                second = matt_clark_parser.get_entries_for_case(1001, year=2019)
+                missing = matt_clark_parser.get_entries_for_case(9999, year=2019)
+
+            assert mock_groupby.call_count == 1
+            assert first == second
+            assert len(first) == 3
+            assert missing == []
+
 
 class TestClearCache:
     """Test clear_cache function."""
@@ -1,6 +1,9 @@
 """Tests for CourtListener API client."""
 
+import json
 import os
+import sqlite3
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +11,54 @@ import pytest
 from src import recap_client
 
 
+@pytest.fixture(autouse=True)
+def close_cache_db():
+    """Close cache connections opened against each test's CACHE_DIR."""
+    yield
+    recap_client.close_cache()
+
+
+@pytest.fixture(autouse=True)
+def full_rate_limit_bucket(monkeypatch):
+    """Start each test with a full token bucket so earlier tests never cause real sleeps."""
+    monkeypatch.setattr(recap_client, "_tokens", float(recap_client.RATE_LIMIT_BURST))
+    monkeypatch.setattr(recap_client, "_last_refill", recap_client.time.monotonic())
+
+
+class FakeClock:
+    """Virtual monotonic clock whose sleep() advances time instead of blocking."""
+
+    def __init__(self, start: float):
+        self.now = start
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        """Let time pass without a sleep() call."""
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive rate limiting and backoff from a FakeClock, starting with a full bucket.
+
+    Only retry sleeps are recorded while a test stays within RATE_LIMIT_BURST
+    requests.
+    """
+    clock = FakeClock(1000.0)
+    monkeypatch.setattr(recap_client.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(recap_client.time, "sleep", clock.sleep)
+    monkeypatch.setattr(recap_client, "_tokens", float(recap_client.RATE_LIMIT_BURST))
+    monkeypatch.setattr(recap_client, "_last_refill", clock.now)
+    return clock
+
+
 def test_placeholder():
     """Placeholder test to verify module imports."""
     assert recap_client is not None
@@ -35,23 +86,47 @@ def test_api_connection(monkeypatch):
     mock_response.status_code = 200
     mock_response.raise_for_status = Mock()
 
-    with patch("src.recap_client.requests.get", return_value=mock_response) as mock_get:
+    with patch("src.recap_client._session.head", return_value=mock_response) as mock_head:
         result = recap_client.check_api_connection()
 
         assert result is True
-        mock_get.assert_called_once_with(
+        mock_head.assert_called_once_with(
             recap_client.BASE_URL,
             headers={"Authorization": "Token test_token_123"},
             timeout=30,
         )
 
 
+def test_api_connection_head_not_allowed(monkeypatch):
+    """Test check_api_connection treats 405 to HEAD as an authenticated connection."""
+    monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
+
+    mock_response = Mock()
+    mock_response.status_code = 405
+    mock_response.raise_for_status = Mock(side_effect=recap_client.requests.HTTPError("405"))
+
+    with patch("src.recap_client._session.head", return_value=mock_response):
+        assert recap_client.check_api_connection() is True
+
+
+def test_api_connection_unauthorized(monkeypatch):
+    """Test check_api_connection returns False when the token is rejected."""
+    monkeypatch.setenv("COURTLISTENER_API_TOKEN", "bad_token")
+
+    mock_response = Mock()
+    mock_response.status_code = 401
+    mock_response.raise_for_status = Mock(side_effect=recap_client.requests.HTTPError("401"))
+
+    with patch("src.recap_client._session.head", return_value=mock_response):
+        assert recap_client.check_api_connection() is False
+
+
 def test_api_connection_failure(monkeypatch):
     """Test check_api_connection returns False on API error."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
-    with patch("src.recap_client.requests.get") as mock_get:
-        mock_get.side_effect = recap_client.requests.RequestException("Connection error")
+    with patch("src.recap_client._session.head") as mock_head:
+        mock_head.side_effect = recap_client.requests.RequestException("Connection error")
         result = recap_client.check_api_connection()
 
         assert result is False
@@ -64,40 +139,51 @@ def test_api_connection_missing_token(monkeypatch):
     assert result is False
 
 
-def test_rate_limiting(monkeypatch):
-    """Test rate limiting enforces 1 request per second."""
+def test_rate_limiting(monkeypatch, fake_clock):
+    """Test rate limiting enforces 1 request per second once the burst is spent."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
-    # Set last request time to simulate a previous request at t=0
-    # This way we can test the rate limiting logic cleanly
-    recap_client._last_request_time = 100.0
-
-    # Mock time.time to return controlled values
-    time_values = [
-        100.3,  # First call to time.time() in rate_limit - only 0.3s passed, need to wait
-        101.0,  # First call to time.time() after sleep (update _last_request_time)
-        102.5,  # Second call to time.time() in rate_limit - 1.5s passed, no wait needed
-        102.5,  # Second call to time.time() after sleep (update _last_request_time)
-    ]
-    time_iter = iter(time_values)
+    # Start with an empty bucket last refilled 0.3s ago
+    monkeypatch.setattr(recap_client, "_tokens", 0.0)
+    monkeypatch.setattr(recap_client, "_last_refill", fake_clock.now - 0.3)
 
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.raise_for_status = Mock()
+    monkeypatch.setattr(recap_client._session, "head", Mock(return_value=mock_response))
+
+    # First request - only 0.3 tokens accrued, should wait 0.7s
+    recap_client.check_api_connection()
+    assert fake_clock.sleeps == [pytest.approx(0.7)]
+
+    # Second request - 1.5s after the wait ended, no wait needed
+    fake_clock.advance(1.5)
+    recap_client.check_api_connection()
+    assert len(fake_clock.sleeps) == 1
+
+
+def test_rate_limit_allows_burst(fake_clock):
+    """Test a full bucket lets RATE_LIMIT_BURST requests through before pacing."""
+    for _ in range(recap_client.RATE_LIMIT_BURST):
+        recap_client.rate_limit()
+    assert fake_clock.sleeps == []
+
+    recap_client.rate_limit()
 
-    with patch("src.recap_client.time.time", side_effect=lambda: next(time_iter)):
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            with patch("src.recap_client.requests.get", return_value=mock_response):
-                # First request - should wait 0.7s (1.0 - 0.3)
-                recap_client.check_api_connection()
+    assert fake_clock.sleeps == [recap_client.RATE_LIMIT_SECONDS]
 
-                # Second request - no wait needed (1.5s > 1.0s)
-                recap_client.check_api_connection()
 
-    # Verify sleep was called exactly once with correct duration
-    assert mock_sleep.call_count == 1
-    call_args = mock_sleep.call_args[0][0]
-    assert abs(call_args - 0.7) < 0.01  # Allow small floating point tolerance
+def test_defer_rate_limit_holds_back_next_request(fake_clock):
+    """Test a deferral makes the next rate_limit() wait out the backoff, even with burst credit."""
+    recap_client._defer_rate_limit(10.0)
+
+    recap_client.rate_limit()
+
+    assert fake_clock.sleeps == [pytest.approx(10.0)]
+
+    # Burst credit is gone: the following request waits for a fresh token
+    recap_client.rate_limit()
+    assert fake_clock.sleeps[1:] == [pytest.approx(recap_client.RATE_LIMIT_SECONDS)]
 
 
 def test_caching(tmp_path, monkeypatch):
@@ -113,10 +199,9 @@ def test_caching(tmp_path, monkeypatch):
     result = recap_client.read_cache(cache_type, key)
     assert result is None
 
-    # Test write_cache creates file with correct JSON
+    # Test write_cache stores the entry in the SQLite cache
     recap_client.write_cache(cache_type, key, test_data)
-    cache_file = tmp_path / cache_type / f"{key}.json"
-    assert cache_file.exists()
+    assert (tmp_path / recap_client.CACHE_DB_NAME).exists()
 
     # Test read_cache returns the cached data
     cached_result = recap_client.read_cache(cache_type, key)
@@ -131,6 +216,35 @@ def test_caching(tmp_path, monkeypatch):
     assert entries_result == entries_data
 
 
+def test_cache_reads_legacy_json_and_corrupt_entries_are_misses(tmp_path, monkeypatch):
+    """Test that pre-SQLite JSON cache files are still read and corrupt ones are misses."""
+    monkeypatch.setattr(recap_client, "CACHE_DIR", tmp_path)
+    (tmp_path / "entries").mkdir()
+
+    (tmp_path / "entries" / "123.json").write_text('[{"entry_number": 1}]')
+    assert recap_client.read_cache("entries", "123") == [{"entry_number": 1}]
+
+    # Simulate a truncated file left by an older, non-atomic write
+    (tmp_path / "entries" / "456.json").write_text('[{"entry_num')
+    assert recap_client.read_cache("entries", "456") is None
+
+    # A fresh write takes precedence over the legacy file
+    recap_client.write_cache("entries", "456", [{"entry_number": 2}])
+    assert recap_client.read_cache("entries", "456") == [{"entry_number": 2}]
+
+
+def test_cache_persists_across_connections(tmp_path, monkeypatch):
+    """Test that cached entries survive closing and reopening the cache database."""
+    monkeypatch.setattr(recap_client, "CACHE_DIR", tmp_path)
+
+    recap_client.write_cache("dockets", "nysd_1", {"id": 1})
+    recap_client.write_cache("dockets", "nysd_1", {"id": 2})
+    recap_client.close_cache()
+
+    assert recap_client.read_cache("dockets", "nysd_1") == {"id": 2}
+    assert recap_client.read_cache("entries", "nysd_1") is None
+
+
 def test_docket_lookup(tmp_path, monkeypatch):
     """Test search_case() looks up dockets via CourtListener API."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
@@ -158,7 +272,7 @@ def test_docket_lookup(tmp_path, monkeypatch):
     mock_response.raise_for_status = Mock()
     mock_response.json.return_value = sample_response
 
-    with patch("src.recap_client.requests.get", return_value=mock_response) as mock_get:
+    with patch("src.recap_client._session.get", return_value=mock_response) as mock_get:
         result = recap_client.search_case("2019cv01234", "nysd")
 
         # Verify correct URL called
@@ -188,7 +302,7 @@ def test_docket_lookup_cache_hit(tmp_path, monkeypatch):
     }
     recap_client.write_cache("dockets", "nysd_2019cv01234", cached_docket)
 
-    with patch("src.recap_client.requests.get") as mock_get:
+    with patch("src.recap_client._session.get") as mock_get:
         result = recap_client.search_case("2019cv01234", "nysd")
 
         # Verify no API call was made
@@ -216,7 +330,7 @@ def test_docket_lookup_not_found(tmp_path, monkeypatch):
     mock_response.raise_for_status = Mock()
     mock_response.json.return_value = empty_response
 
-    with patch("src.recap_client.requests.get", return_value=mock_response):
+    with patch("src.recap_client._session.get", return_value=mock_response):
         result = recap_client.search_case("9999cv99999", "nysd")
 
         assert result is None
@@ -240,7 +354,7 @@ def test_negative_cache(tmp_path, monkeypatch):
     mock_response.raise_for_status = Mock()
     mock_response.json.return_value = empty_response
 
-    with patch("src.recap_client.requests.get", return_value=mock_response) as mock_get:
+    with patch("src.recap_client._session.get", return_value=mock_response) as mock_get:
         # First call: should hit API and cache the negative result
         result1 = recap_client.search_case("nonexistent_case", "nysd")
         assert result1 is None
@@ -251,47 +365,161 @@ def test_negative_cache(tmp_path, monkeypatch):
         assert result2 is None
         assert mock_get.call_count == 1  # No additional API call
 
-    # Verify cache file contains NEGATIVE_CACHE_SENTINEL
-    cache_file = tmp_path / "dockets" / "nysd_nonexistent_case.json"
-    assert cache_file.exists()
+    # Verify the cache holds NEGATIVE_CACHE_SENTINEL
     cached_data = recap_client.read_cache("dockets", "nysd_nonexistent_case")
     assert cached_data == recap_client.NEGATIVE_CACHE_SENTINEL
 
 
-def test_429_handling(monkeypatch):
-    """Test _make_request retries once after HTTP 429 rate limit response."""
+def test_negative_cache_expires_after_ttl(tmp_path, monkeypatch):
+    """Test search_case() re-queries the API once a negative cache entry expires."""
+    monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
+    monkeypatch.setattr(recap_client, "CACHE_DIR", tmp_path)
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(recap_client.time, "time", lambda: now[0])
+
+    recap_client.write_cache("dockets", "nysd_late_case", recap_client.NEGATIVE_CACHE_SENTINEL)
+
+    # Within the TTL the negative entry is still served
+    now[0] += recap_client.NEGATIVE_CACHE_TTL_SECONDS
+    assert recap_client.read_cache("dockets", "nysd_late_case") == recap_client.NEGATIVE_CACHE_SENTINEL
+
+    # Past the TTL it is dropped and the case is looked up again
+    now[0] += 1
+    docket = {"id": 42, "docket_number": "late_case"}
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.raise_for_status = Mock()
+    mock_response.json.return_value = {"results": [docket]}
+
+    with patch("src.recap_client._session.get", return_value=mock_response) as mock_get:
+        assert recap_client.search_case("late_case", "nysd") == docket
+        assert mock_get.call_count == 1
+
+    assert recap_client.read_cache("dockets", "nysd_late_case") == docket
+
+
+def test_negative_cache_ttl_applies_to_legacy_json(tmp_path, monkeypatch):
+    """Test expired negative entries in legacy JSON files are removed on read."""
+    monkeypatch.setattr(recap_client, "CACHE_DIR", tmp_path)
+
+    legacy_path = recap_client.get_cache_path("dockets", "nysd_old_case")
+    legacy_path.parent.mkdir(parents=True)
+    legacy_path.write_text(json.dumps(recap_client.NEGATIVE_CACHE_SENTINEL))
+
+    expired = legacy_path.stat().st_mtime + recap_client.NEGATIVE_CACHE_TTL_SECONDS + 1
+    monkeypatch.setattr(recap_client.time, "time", lambda: expired)
+
+    assert recap_client.read_cache("dockets", "nysd_old_case") is None
+    assert not legacy_path.exists()
+
+
+def test_cache_db_without_written_at_is_migrated(tmp_path, monkeypatch):
+    """Test a cache database from before written_at gains the column on open."""
+    monkeypatch.setattr(recap_client, "CACHE_DIR", tmp_path)
+
+    conn = sqlite3.connect(tmp_path / recap_client.CACHE_DB_NAME)
+    conn.execute(
+        "CREATE TABLE cache (type TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, "
+        "PRIMARY KEY (type, key)) WITHOUT ROWID"
+    )
+    conn.execute("INSERT INTO cache VALUES ('entries', '1', '[1, 2]')")
+    conn.commit()
+    conn.close()
+
+    assert recap_client.read_cache("entries", "1") == [1, 2]
+    recap_client.write_cache("entries", "2", {"ok": True})
+    assert recap_client.read_cache("entries", "2") == {"ok": True}
+
+
+def test_429_handling(monkeypatch, fake_clock):
+    """Test _make_request retries after HTTP 429, waiting for Retry-After."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
     # First response: 429 rate limit
     mock_response_429 = Mock()
     mock_response_429.status_code = 429
+    mock_response_429.headers = {"Retry-After": "7"}
 
     # Second response: 200 success
     mock_response_200 = Mock()
     mock_response_200.status_code = 200
     mock_response_200.raise_for_status = Mock()
 
-    with patch("src.recap_client.requests.get", side_effect=[mock_response_429, mock_response_200]) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            # Reset rate limit timer to avoid interference
-            recap_client._last_request_time = 0
+    with patch("src.recap_client._session.get", side_effect=[mock_response_429, mock_response_200]) as mock_get:
+        result = recap_client._make_request(
+            "https://example.com/api",
+            {"Authorization": "Token test"},
+        )
+
+    # Verify retry happened
+    assert mock_get.call_count == 2
+
+    # Verify the only sleep was the server's Retry-After
+    assert fake_clock.sleeps == [7.0]
 
-            result = recap_client._make_request(
-                "https://example.com/api",
-                {"Authorization": "Token test"},
-            )
+    # Verify successful response returned
+    assert result.status_code == 200
 
-            # Verify retry happened
-            assert mock_get.call_count == 2
 
-            # Verify sleep was called with retry delay
-            mock_sleep.assert_called_with(recap_client.RATE_LIMIT_RETRY_DELAY)
+def test_429_backoff_without_retry_after(fake_clock):
+    """Test 429 retries back off exponentially with jitter and give up after max_retries."""
+    mock_response_429 = Mock()
+    mock_response_429.status_code = 429
+    mock_response_429.headers = {}
+
+    with patch("src.recap_client._session.get", return_value=mock_response_429) as mock_get, \
+         patch("src.recap_client.random.uniform", return_value=0.5):
+        result = recap_client._make_request(
+            "https://example.com/api",
+            {"Authorization": "Token test"},
+            max_retries=2,
+        )
 
-            # Verify successful response returned
-            assert result.status_code == 200
+    assert result.status_code == 429
+    assert mock_get.call_count == 3
+    base = recap_client.RATE_LIMIT_RETRY_DELAY
+    backoff_sleeps = [delay for delay in fake_clock.sleeps if delay >= base]
+    assert backoff_sleeps == [base + 0.5, base * 2 + 0.5]
 
 
-def test_exponential_backoff(monkeypatch):
+def test_429_retried_once_when_max_retries_is_zero(fake_clock):
+    """Test a 429 still gets one retry when transient-error retries are disabled."""
+    mock_response_429 = Mock()
+    mock_response_429.status_code = 429
+    mock_response_429.headers = {"Retry-After": "2"}
+
+    mock_response_500 = Mock()
+    mock_response_500.status_code = 500
+
+    with patch(
+        "src.recap_client._session.get",
+        side_effect=[mock_response_429, mock_response_500],
+    ) as mock_get:
+        result = recap_client._make_request(
+            "https://example.com/api",
+            {"Authorization": "Token test"},
+            max_retries=0,
+        )
+
+    # The 429 is retried, but the 5xx that follows is not
+    assert mock_get.call_count == 2
+    assert fake_clock.sleeps == [2.0]
+    assert result.status_code == 500
+
+
+def test_parse_retry_after_http_date():
+    """Test Retry-After given as an HTTP date is converted to seconds."""
+    with patch("src.recap_client.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        delay = recap_client._parse_retry_after("Mon, 01 Jan 2024 12:00:30 GMT")
+
+    assert delay == 30.0
+    assert recap_client._parse_retry_after("not a date") is None
+    assert recap_client._parse_retry_after("-3") == 0.0
+
+
+def test_exponential_backoff(monkeypatch, fake_clock):
     """Test _make_request uses exponential backoff for 5xx errors."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
@@ -307,42 +535,45 @@ def test_exponential_backoff(monkeypatch):
     mock_response_200.status_code = 200
     mock_response_200.raise_for_status = Mock()
 
-    with patch(
-        "src.recap_client.requests.get",
-        side_effect=[mock_response_500_1, mock_response_500_2, mock_response_200]
-    ) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            # Mock time.time to return incrementing values to avoid rate limit sleeps
-            time_counter = [1000.0]
+    mock_get = Mock(side_effect=[mock_response_500_1, mock_response_500_2, mock_response_200])
+    monkeypatch.setattr(recap_client._session, "get", mock_get)
+    monkeypatch.setattr(recap_client.random, "uniform", lambda low, high: high)
+
+    result = recap_client._make_request(
+        "https://example.com/api",
+        {"Authorization": "Token test"},
+    )
+
+    # Verify retries happened (3 total requests)
+    assert mock_get.call_count == 3
+
+    # Verify exponential backoff ceilings (jitter pinned to the max)
+    # First retry: 1.0 * (2.0 ** 0) = 1.0s
+    # Second retry: 1.0 * (2.0 ** 1) = 2.0s
+    assert fake_clock.sleeps == [1.0, 2.0]
 
-            def mock_time():
-                time_counter[0] += 2.0  # Increment by 2s each call (> RATE_LIMIT_SECONDS)
-                return time_counter[0]
+    # Verify successful response returned
+    assert result.status_code == 200
 
-            with patch("src.recap_client.time.time", side_effect=mock_time):
-                recap_client._last_request_time = 0
 
-                result = recap_client._make_request(
-                    "https://example.com/api",
-                    {"Authorization": "Token test"},
-                )
+def test_backoff_delay_full_jitter():
+    """Test _backoff_delay draws from zero up to the capped exponential ceiling."""
+    with patch("src.recap_client.random.uniform", return_value=0.25) as mock_uniform:
+        assert recap_client._backoff_delay(0) == 0.25
+        mock_uniform.assert_called_with(0, 1.0)
 
-                # Verify retries happened (3 total requests)
-                assert mock_get.call_count == 3
+        recap_client._backoff_delay(2)
+        mock_uniform.assert_called_with(0, 4.0)
 
-                # Verify exponential backoff delays
-                # First retry: 1.0 * (2.0 ** 0) = 1.0s
-                # Second retry: 1.0 * (2.0 ** 1) = 2.0s
-                sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
-                assert len(sleep_calls) == 2
-                assert sleep_calls[0] == 1.0  # First backoff delay
-                assert sleep_calls[1] == 2.0  # Second backoff delay
+        recap_client._backoff_delay(10)
+        mock_uniform.assert_called_with(0, recap_client.BACKOFF_MAX_DELAY)
 
-                # Verify successful response returned
-                assert result.status_code == 200
+    for attempt in range(5):
+        delay = recap_client._backoff_delay(attempt)
+        assert 0 <= delay <= recap_client.BACKOFF_BASE_DELAY * (2 ** attempt)
 
 
-def test_exponential_backoff_max_retries_exhausted(monkeypatch):
+def test_exponential_backoff_max_retries_exhausted(monkeypatch, fake_clock):
     """Test _make_request returns error response when max retries exhausted for 5xx."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
@@ -350,37 +581,25 @@ def test_exponential_backoff_max_retries_exhausted(monkeypatch):
     mock_response_500 = Mock()
     mock_response_500.status_code = 500
 
-    with patch(
-        "src.recap_client.requests.get",
-        return_value=mock_response_500
-    ) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            # Mock time.time to return incrementing values to avoid rate limit sleeps
-            time_counter = [1000.0]
-
-            def mock_time():
-                time_counter[0] += 2.0
-                return time_counter[0]
-
-            with patch("src.recap_client.time.time", side_effect=mock_time):
-                recap_client._last_request_time = 0
+    mock_get = Mock(return_value=mock_response_500)
+    monkeypatch.setattr(recap_client._session, "get", mock_get)
 
-                result = recap_client._make_request(
-                    "https://example.com/api",
-                    {"Authorization": "Token test"},
-                )
+    result = recap_client._make_request(
+        "https://example.com/api",
+        {"Authorization": "Token test"},
+    )
 
-                # Verify all retries were attempted (initial + 3 retries = 4)
-                assert mock_get.call_count == 4
+    # Verify all retries were attempted (initial + 3 retries = 4)
+    assert mock_get.call_count == 4
 
-                # Verify backoff delays (3 sleeps for retries)
-                assert mock_sleep.call_count == 3
+    # Verify backoff delays (3 sleeps for retries)
+    assert len(fake_clock.sleeps) == 3
 
-                # Verify error response returned after exhausting retries
-                assert result.status_code == 500
+    # Verify error response returned after exhausting retries
+    assert result.status_code == 500
 
 
-def test_exponential_backoff_connection_error(monkeypatch):
+def test_exponential_backoff_connection_error(monkeypatch, fake_clock):
     """Test _make_request retries on connection errors with exponential backoff."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
@@ -389,44 +608,30 @@ def test_exponential_backoff_connection_error(monkeypatch):
     mock_response_200.raise_for_status = Mock()
 
     # First two calls raise ConnectionError, third succeeds
-    with patch(
-        "src.recap_client.requests.get",
-        side_effect=[
-            recap_client.requests.ConnectionError("Connection refused"),
-            recap_client.requests.ConnectionError("Connection refused"),
-            mock_response_200,
-        ]
-    ) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            # Mock time.time to return incrementing values to avoid rate limit sleeps
-            time_counter = [1000.0]
-
-            def mock_time():
-                time_counter[0] += 2.0
-                return time_counter[0]
-
-            with patch("src.recap_client.time.time", side_effect=mock_time):
-                recap_client._last_request_time = 0
+    mock_get = Mock(side_effect=[
+        recap_client.requests.ConnectionError("Connection refused"),
+        recap_client.requests.ConnectionError("Connection refused"),
+        mock_response_200,
+    ])
+    monkeypatch.setattr(recap_client._session, "get", mock_get)
+    monkeypatch.setattr(recap_client.random, "uniform", lambda low, high: high)
 
-                result = recap_client._make_request(
-                    "https://example.com/api",
-                    {"Authorization": "Token test"},
-                )
+    result = recap_client._make_request(
+        "https://example.com/api",
+        {"Authorization": "Token test"},
+    )
 
-                # Verify retries happened
-                assert mock_get.call_count == 3
+    # Verify retries happened
+    assert mock_get.call_count == 3
 
-                # Verify exponential backoff delays
-                sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
-                assert len(sleep_calls) == 2
-                assert sleep_calls[0] == 1.0
-                assert sleep_calls[1] == 2.0
+    # Verify exponential backoff delays
+    assert fake_clock.sleeps == [1.0, 2.0]
 
-                # Verify successful response returned
-                assert result.status_code == 200
+    # Verify successful response returned
+    assert result.status_code == 200
 
 
-def test_exponential_backoff_timeout_error(monkeypatch):
+def test_exponential_backoff_timeout_error(monkeypatch, fake_clock):
     """Test _make_request retries on timeout errors with exponential backoff."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
@@ -435,123 +640,75 @@ def test_exponential_backoff_timeout_error(monkeypatch):
     mock_response_200.raise_for_status = Mock()
 
     # First call raises Timeout, second succeeds
-    with patch(
-        "src.recap_client.requests.get",
-        side_effect=[
-            recap_client.requests.Timeout("Request timed out"),
-            mock_response_200,
-        ]
-    ) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            # Mock time.time to return incrementing values to avoid rate limit sleeps
-            time_counter = [1000.0]
-
-            def mock_time():
-                time_counter[0] += 2.0
-                return time_counter[0]
-
-            with patch("src.recap_client.time.time", side_effect=mock_time):
-                recap_client._last_request_time = 0
-
-                result = recap_client._make_request(
-                    "https://example.com/api",
-                    {"Authorization": "Token test"},
-                )
-
-                # Verify retry happened
-                assert mock_get.call_count == 2
-
-                # Verify backoff delay
-                mock_sleep.assert_called_with(1.0)
-
-                # Verify successful response returned
-                assert result.status_code == 200
-
-
-def test_max_retries(monkeypatch):
+    mock_get = Mock(side_effect=[
+        recap_client.requests.Timeout("Request timed out"),
+        mock_response_200,
+    ])
+    monkeypatch.setattr(recap_client._session, "get", mock_get)
+    monkeypatch.setattr(recap_client.random, "uniform", lambda low, high: high)
+
+    result = recap_client._make_request(
+        "https://example.com/api",
+        {"Authorization": "Token test"},
+    )
+
+    # Verify retry happened
+    assert mock_get.call_count == 2
+
+    # Verify backoff delay
+    assert fake_clock.sleeps == [1.0]
+
+    # Verify successful response returned
+    assert result.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "max_retries,expected_calls",
+    [
+        (0, 1),  # No retries, only 1 attempt
+        (1, 2),  # 1 initial + 1 retry
+        (None, 4),  # Default BACKOFF_MAX_RETRIES (3): 1 + 3 retries
+    ],
+)
+def test_max_retries(monkeypatch, fake_clock, max_retries, expected_calls):
     """Test _make_request respects configurable max_retries parameter."""
     monkeypatch.setenv("COURTLISTENER_API_TOKEN", "test_token_123")
 
     # All responses are 500 errors
     mock_response_500 = Mock()
     mock_response_500.status_code = 500
+    mock_get = Mock(return_value=mock_response_500)
+    monkeypatch.setattr(recap_client._session, "get", mock_get)
 
-    # Test max_retries=0: No retries, only 1 attempt
-    with patch(
-        "src.recap_client.requests.get",
-        return_value=mock_response_500
-    ) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            time_counter = [1000.0]
-
-            def mock_time():
-                time_counter[0] += 2.0
-                return time_counter[0]
+    kwargs = {} if max_retries is None else {"max_retries": max_retries}
+    result = recap_client._make_request(
+        "https://example.com/api",
+        {"Authorization": "Token test"},
+        **kwargs,
+    )
 
-            with patch("src.recap_client.time.time", side_effect=mock_time):
-                recap_client._last_request_time = 0
+    assert mock_get.call_count == expected_calls
+    # One backoff sleep before each retry
+    assert len(fake_clock.sleeps) == expected_calls - 1
+    assert result.status_code == 500
 
-                result = recap_client._make_request(
-                    "https://example.com/api",
-                    {"Authorization": "Token test"},
-                    max_retries=0,
-                )
 
-                # Verify only 1 attempt (no retries)
-                assert mock_get.call_count == 1
-                # Verify no backoff sleeps
-                assert mock_sleep.call_count == 0
-                assert result.status_code == 500
+def test_session_pools_https_connections():
+    """Test requests share one session with a pooled HTTPS adapter."""
+    adapter = recap_client._session.get_adapter(recap_client.BASE_URL)
 
-    # Test max_retries=1: Only 1 retry, 2 total attempts
-    with patch(
-        "src.recap_client.requests.get",
-        return_value=mock_response_500
-    ) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            time_counter = [1000.0]
+    assert adapter._pool_connections == recap_client.SESSION_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == recap_client.SESSION_POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+    assert recap_client._session.headers["User-Agent"] == recap_client.USER_AGENT
 
-            def mock_time():
-                time_counter[0] += 2.0
-                return time_counter[0]
 
-            with patch("src.recap_client.time.time", side_effect=mock_time):
-                recap_client._last_request_time = 0
+def test_close_session_replaces_session():
+    """Test close_session closes the pooled session and opens a new one."""
+    old_session = recap_client._session
 
-                result = recap_client._make_request(
-                    "https://example.com/api",
-                    {"Authorization": "Token test"},
-                    max_retries=1,
-                )
+    with patch.object(old_session, "close") as mock_close:
+        recap_client.close_session()
 
-                # Verify 2 total attempts (1 initial + 1 retry)
-                assert mock_get.call_count == 2
-                # Verify 1 backoff sleep
-                assert mock_sleep.call_count == 1
-                assert result.status_code == 500
-
-    # Test default max_retries: Uses BACKOFF_MAX_RETRIES (3), so 4 total attempts
-    with patch(
-        "src.recap_client.requests.get",
-        return_value=mock_response_500
-    ) as mock_get:
-        with patch("src.recap_client.time.sleep") as mock_sleep:
-            time_counter = [1000.0]
-
-            def mock_time():
-                time_counter[0] += 2.0
-                return time_counter[0]
-
-            with patch("src.recap_client.time.time", side_effect=mock_time):
-                recap_client._last_request_time = 0
-
-                result = recap_client._make_request(
-                    "https://example.com/api",
-                    {"Authorization": "Token test"},
-                )
-
-                # Verify default behavior: 4 total attempts (1 + BACKOFF_MAX_RETRIES)
-                assert mock_get.call_count == 4
-                # Verify 3 backoff sleeps
-                assert mock_sleep.call_count == 3
-                assert result.status_code == 500
\ No newline at end of file
+    mock_close.assert_called_once_with()
+    assert recap_client._session is not old_session